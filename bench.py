@@ -0,0 +1,221 @@
+"""Benchmark renders of a fixed set of scenes and keep the numbers over time.
+
+    python bench.py                    # render BENCH_SCENES at low quality, append to the history
+    python bench.py --compare          # same, then compare with the previous matching run
+    python bench.py --compare-only     # just compare the last two matching runs
+    python bench.py --cold-tex -n 3    # empty TeX caches, best of three
+
+Each scene renders in its own interpreter, one after the other, with the
+segment cache off so every frame is drawn and encoded, and with the fixed
+per-scene random seed segments.py gives every scene. A run records, per
+scene, the render wall time, frames per second, peak RSS, the time spent
+building Tex/MathTex mobjects (cache lookups and latex runs included) and the
+time spent handing frames to the encoder, waiting on it and combining the
+partial movies.
+
+Runs are appended to HISTORY together with the commit they were made at.
+Compare mode flags every metric that got worse by more than --threshold
+(relative) and a small absolute margin, and exits non-zero if any did.
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render import MEDIA, QUALITIES, ROOT, render_one
+
+HISTORY = MEDIA / "bench.json"
+
+# one scene per kind of cost: 3D prisms, a long polyline, the implicit Lp
+# ball, lots of TeX and a moving camera
+BENCH_SCENES = ["ThreeFunc", "VFScene", "Lp", "ArcLengthFormula", "NormalVector1"]
+
+# metric -> (+1 if bigger is worse, -1 if smaller is worse, absolute noise margin)
+METRICS = {
+    "wall": (+1, 0.25),
+    "fps": (-1, 0.5),
+    "peak_rss_mb": (+1, 10.0),
+    "tex": (+1, 0.1),
+    "encode": (+1, 0.1),
+}
+
+
+# ru_maxrss is in kilobytes on Linux, in bytes on macOS
+RSS_PER_MB = 1024**2 if sys.platform == "darwin" else 1024
+
+
+def measure(name, quality="l", tex_dir=None):
+    "Render one scene in this process and return its metrics, meant to run in a fresh interpreter."
+    import resource
+
+    from manim.mobject.text.tex_mobject import SingleStringMathTex
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    start = time.perf_counter()
+    importlib.import_module("scene")  # installs texcache and segments
+    import_time = time.perf_counter() - start
+    import texcache
+
+    spent = {"tex": 0.0, "encode": 0.0, "frames": 0}
+
+    def timed(owner, attr, key, counts_frames=False):
+        func = getattr(owner, attr)
+
+        def run(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                spent[key] += time.perf_counter() - start
+                if counts_frames:
+                    spent["frames"] += kwargs.get("repeat", 1)
+
+        setattr(owner, attr, run)
+
+    timed(SingleStringMathTex, "__init__", "tex")
+    timed(texcache.cache, "prefetch", "tex")
+    timed(SceneFileWriter, "write_frame", "encode", counts_frames=True)
+    # segments encode on background threads, what the render waits for is
+    # sealing a stream when too many are in flight and draining them at the end
+    timed(SceneFileWriter, "close_partial_movie_stream", "encode")
+    timed(SceneFileWriter, "join_all_encode_jobs", "encode")
+    timed(SceneFileWriter, "combine_to_movie", "encode")
+
+    overrides = {"disable_caching": True}
+    if tex_dir:
+        overrides["tex_dir"] = tex_dir
+    _, wall, _ = render_one(name, quality, publish=False, overrides=overrides)
+    return {
+        "wall": wall,
+        "import": import_time,
+        "frames": spent["frames"],
+        "fps": spent["frames"] / wall if wall else 0.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / RSS_PER_MB,
+        "tex": spent["tex"],
+        "encode": spent["encode"],
+        "tex_hits": texcache.cache.hits,
+        "tex_misses": texcache.cache.misses,
+    }
+
+
+def run_worker(name, quality, cold_tex):
+    "Metrics of one scene from a fresh interpreter, or {'error': ...}."
+    env = dict(os.environ)
+    command = [sys.executable, __file__, "--worker", name, "-q", quality]
+    with tempfile.TemporaryDirectory() as tmp:
+        if cold_tex:
+            env["TEXCACHE_DIR"] = os.path.join(tmp, "texcache")
+            command += ["--tex-dir", os.path.join(tmp, "Tex")]
+        proc = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_bench(names, quality="l", repeat=1, cold_tex=False):
+    "One history entry: the best of `repeat` renders of every scene."
+    scenes = {}
+    for name in names:
+        runs = [run_worker(name, quality, cold_tex) for _ in range(repeat)]
+        good = [run for run in runs if "error" not in run]
+        scenes[name] = min(good, key=lambda run: run["wall"]) if good else runs[-1]
+        result = scenes[name]
+        if "error" in result:
+            print(f"{name:<26} FAILED  {result['error']}")
+        else:
+            print(f"{name:<26} {result['wall']:7.2f}s {result['fps']:7.1f} fps {result['peak_rss_mb']:7.0f} MB "
+                  f"tex {result['tex']:6.2f}s encode {result['encode']:6.2f}s")
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "quality": quality,
+        "tex": "cold" if cold_tex else "warm",
+        "repeat": repeat,
+        "scenes": scenes,
+    }
+
+
+def load_history(path=HISTORY):
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return []
+
+
+def save_history(history, path=HISTORY):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(old, new, threshold=0.1):
+    "Print old vs new per scene and metric, return the list of regressions."
+    regressions = []
+    print(f"{old['commit']} ({old['date']}) -> {new['commit']} ({new['date']})")
+    for name, after in new["scenes"].items():
+        before = old["scenes"].get(name)
+        if before is None or "error" in before:
+            continue
+        if "error" in after:
+            print(f"{name:<26} rendered before, fails now: {after['error']}")
+            regressions.append((name, "error", None, after["error"]))
+            continue
+        for metric, (direction, margin) in METRICS.items():
+            a, b = before[metric], after[metric]
+            change = (b - a) / a if a else 0.0
+            worse = direction * (b - a) > max(margin, threshold * abs(a))
+            flag = "REGRESSION" if worse else ""
+            print(f"{name:<26} {metric:<12} {a:9.2f} -> {b:9.2f} {change:+7.1%} {flag}")
+            if worse:
+                regressions.append((name, metric, a, b))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help=f"default {' '.join(BENCH_SCENES)}")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-n", "--repeat", type=int, default=1, help="renders per scene, the fastest one counts")
+    parser.add_argument("--cold-tex", action="store_true", help="start every render with empty TeX caches")
+    parser.add_argument("--compare", action="store_true", help="compare with the previous matching run")
+    parser.add_argument("--compare-only", action="store_true",
+                        help="compare the last two matching runs, render nothing")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change that counts as a regression")
+    parser.add_argument("--history", default=str(HISTORY))
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--tex-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.quality, args.tex_dir)))
+        return
+
+    path = Path(args.history)
+    history = load_history(path)
+    tex = "cold" if args.cold_tex else "warm"
+    matching = [entry for entry in history if entry["quality"] == args.quality and entry["tex"] == tex]
+    if args.compare_only:
+        if len(matching) < 2:
+            parser.error("need two runs with this quality and TeX mode in the history")
+        sys.exit(bool(compare(matching[-2], matching[-1], args.threshold)))
+
+    entry = run_bench(args.scenes or BENCH_SCENES, args.quality, args.repeat, args.cold_tex)
+    save_history(history + [entry], path)
+    if args.compare and matching:
+        sys.exit(bool(compare(matching[-1], entry, args.threshold)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Matplotlib colormaps as lookup tables the scenes can index with numpy arrays.
+
+The scenes used to colour curves with ``mcolors.rgb2hex(plt.cm.hsv(t / period))``
+one value at a time. A matplotlib colormap is itself a table of N colours, so
+the table is read once here (rounded to 8 bits per channel, like the hex
+strings were) and ``rgba`` looks up whole arrays of parameters at once.
+
+The table is only read the first time a colour is asked for, so importing
+scene.py (and the RAINBOW below) does not pull in matplotlib.
+"""
+from functools import cached_property
+
+import numpy as np
+from manim import ManimColor
+
+
+class Colormap:
+    def __init__(self, name="hsv", period=1.0):
+        self.name = name
+        self.period = period
+
+    @cached_property
+    def lut(self):
+        from matplotlib import colormaps
+
+        cmap = colormaps[self.name]
+        lut = cmap(np.arange(cmap.N))
+        lut[:, :3] = np.round(lut[:, :3] * 255) / 255
+        return lut
+
+    @property
+    def n(self):
+        return len(self.lut)
+
+    def __repr__(self):
+        return f"Colormap({self.name!r}, period={self.period!r})"
+
+    def indices(self, values):
+        # the same bin matplotlib picks for value / period, out of range clamps to the ends
+        scaled = np.asarray(values, dtype=float) * (self.n / self.period)
+        return np.clip(scaled, -1, self.n).astype(int).clip(0, self.n - 1)
+
+    def rgba(self, values):
+        "(..., 4) array of colours for an array of parameters."
+        return self.lut[self.indices(values)]
+
+    def __call__(self, value):
+        "The colour of one parameter, for set_color and friends."
+        return ManimColor(self.lut[self.indices(value)])
+
+    def paint(self, mobjects, values):
+        "Colour mobjects[i] by values[i], with one table lookup for all of them."
+        for mob, rgba in zip(mobjects, self.rgba(values)):
+            mob.set_color(ManimColor(rgba))
+        return mobjects
+
+
+# the rainbow the multivariable chapter colours tangent vectors and curves with
+RAINBOW = Colormap("hsv", period=2 * np.pi)
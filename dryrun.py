@@ -0,0 +1,195 @@
+"""Run scenes from scene.py without drawing or encoding a single frame.
+
+    python dryrun.py NormalVector1          # one scene, timing of a high quality render
+    python dryrun.py -q l                   # every scene, at 15 fps
+    python dryrun.py VF --json vf.json      # also keep the per-play numbers
+
+construct() runs in full: every play and updating wait steps through its frames,
+animations interpolate and updaters run with the dt of the chosen quality, but
+the camera never rasterizes and nothing is written to disk. For each play the
+report lists its run time, frames, the time spent in animations and in
+updaters, how many mobjects are on screen, how many updaters they carry, how
+many of them hold NaN/inf points, and the numpy warnings raised since the
+previous play, so a division by a tiny h shows up next to the play it breaks.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import sys
+import time
+import traceback
+import warnings
+
+import numpy as np
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from render import QUALITIES, discover
+
+
+class DryRunRenderer(CairoRenderer):
+    "Steps every frame of every play through the scene and records what it cost, never draws one."
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.plays = []
+        self.frames = 0
+        self.caught = []
+        self.reported = 0
+
+    def init_scene(self, scene, *args, **kwargs):
+        super().init_scene(scene, *args, **kwargs)
+        self.clock = {"step": 0.0, "updaters": 0.0}
+        clock = self.clock
+        update_to_time, update_mobjects, update_self = scene.update_to_time, scene.update_mobjects, scene.update_self
+
+        # instance attributes shadow the methods Scene.play_internal looks up on self
+        def timed_update_to_time(t):
+            start = time.perf_counter()
+            update_to_time(t)
+            clock["step"] += time.perf_counter() - start
+
+        def timed(update):
+            def run(dt):
+                start = time.perf_counter()
+                update(dt)
+                clock["updaters"] += time.perf_counter() - start
+            return run
+
+        scene.update_to_time = timed_update_to_time
+        scene.update_mobjects = timed(update_mobjects)
+        scene.update_self = timed(update_self)
+
+    def play(self, scene, *args, **kwargs):
+        clock = self.clock
+        clock.update(step=0.0, updaters=0.0)
+        start, scene_time, frames = time.perf_counter(), self.time, self.frames
+        super().play(scene, *args, **kwargs)
+        wall = time.perf_counter() - start
+
+        family = [mob for top in scene.mobjects for mob in top.get_family()]
+        new_warnings = self.caught[self.reported:]
+        self.reported = len(self.caught)
+        self.plays.append({
+            "play": len(self.plays),
+            "animations": [type(animation).__name__ for animation in scene.animations],
+            "run_time": self.time - scene_time,
+            "frames": self.frames - frames,
+            "wall": wall,
+            "animate": clock["step"] - clock["updaters"],
+            "updaters": clock["updaters"],
+            "setup": wall - clock["step"],
+            "mobjects": len(family),
+            "updater_count": sum(len(mob.updaters) for mob in family) + len(scene.updaters),
+            "nonfinite": sum(1 for mob in family if len(mob.points) and not np.isfinite(mob.points).all()),
+            "warnings": sorted({f"{w.category.__name__}: {w.message}" for w in new_warnings}),
+        })
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+    def render(self, scene, time, moving_mobjects):
+        self.time += 1 / self.camera.frame_rate
+        self.frames += 1
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        frames = int(duration / dt)
+        self.time += frames * dt
+        self.frames += frames
+
+
+def camera_class_of(scene_class):
+    "The camera a scene class builds by default, a renderer handed to Scene() has to bring its own."
+    for cls in scene_class.__mro__:
+        parameter = inspect.signature(cls.__init__).parameters.get("camera_class")
+        if parameter is not None:
+            return parameter.default
+
+
+def dry_run(name, quality="h", module_name="scene"):
+    "Run scene `name` headless, returns its summary dict with the per-play list under 'plays'."
+    with tempconfig({"quality": QUALITIES[quality], "dry_run": True, "disable_caching": True,
+                     "progress_bar": "none", "verbosity": "WARNING"}):
+        scene_class = getattr(importlib.import_module(module_name), name)
+        renderer = DryRunRenderer(camera_class=camera_class_of(scene_class))
+        scene = scene_class(renderer=renderer)
+
+        error = None
+        start = time.perf_counter()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            renderer.caught = caught
+            try:
+                scene.render()
+            except Exception:
+                error = traceback.format_exc()
+        wall = time.perf_counter() - start
+
+    plays = renderer.plays
+    return {
+        "scene": name,
+        "quality": quality,
+        "duration": renderer.time,
+        "frames": renderer.frames,
+        "plays": plays,
+        "wall": wall,
+        "animate": sum(play["animate"] for play in plays),
+        "updaters": sum(play["updaters"] for play in plays),
+        "max_mobjects": max((play["mobjects"] for play in plays), default=0),
+        "warnings": sorted({w for play in plays for w in play["warnings"]}),
+        "error": error,
+    }
+
+
+def print_report(report, verbose=True):
+    if verbose:
+        print(f"{report['scene']}")
+        print(f"  {'play':>4} {'run':>6} {'frames':>6} {'animate':>8} {'updaters':>8} {'setup':>7} "
+              f"{'mobs':>6} {'upd':>4} {'nan':>4}  animations")
+        for play in report["plays"]:
+            names = ", ".join(play["animations"])
+            print(f"  {play['play']:>4} {play['run_time']:6.2f} {play['frames']:>6} {play['animate']:8.3f} "
+                  f"{play['updaters']:8.3f} {play['setup']:7.3f} {play['mobjects']:>6} {play['updater_count']:>4} "
+                  f"{play['nonfinite']:>4}  {names[:60]}")
+            for message in play["warnings"]:
+                print(f"{'':>7}! {message}")
+    status = "FAILED" if report["error"] else "ok"
+    print(f"{report['scene']:<26} {status:<6} {report['duration']:7.2f}s of video, {report['frames']} frames, "
+          f"{len(report['plays'])} plays, {report['wall']:6.2f}s wall "
+          f"({report['animate']:.2f}s animations, {report['updaters']:.2f}s updaters), "
+          f"up to {report['max_mobjects']} mobjects")
+    if report["error"]:
+        print(report["error"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names, default all")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h", help="sets the frame rate that is stepped")
+    parser.add_argument("--json", help="write the reports to this file")
+    parser.add_argument("--summary", action="store_true", help="one line per scene, no per-play table")
+    args = parser.parse_args()
+
+    names = discover()
+    unknown = set(args.scenes) - set(names)
+    if unknown:
+        parser.error(f"unknown scenes: {', '.join(sorted(unknown))}")
+    reports = []
+    for name in args.scenes or names:
+        report = dry_run(name, args.quality)
+        print_report(report, verbose=not args.summary)
+        reports.append(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    sys.exit(any(report["error"] for report in reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,528 @@
+"""Batched replacements for the mobjects scene.py builds one at a time."""
+from math import ceil, floor
+
+import numpy as np
+from manim import (BLACK, BLUE, DEFAULT_ARROW_TIP_LENGTH, DEFAULT_STROKE_WIDTH, ORIGIN, OUT, RIGHT, WHITE, ManimColor,
+                   ParametricFunction, PMobject, Vector, VGroup, VMobject, color_to_rgb, config, sigmoid)
+from manim.mobject.vector_field import DEFAULT_SCALAR_FIELD_COLORS
+from manim.utils.bezier import partial_bezier_points
+
+
+# straight-edge cubic control points as weights on the corners
+SHAFT_WEIGHTS = np.array([[1, 0], [2 / 3, 1 / 3], [1 / 3, 2 / 3], [0, 1]])
+TRIANGLE_WEIGHTS = np.concatenate([SHAFT_WEIGHTS @ np.eye(3)[[i, (i + 1) % 3]] for i in range(3)])
+
+
+def segments_to_points(vertices):
+    """(N, 3) polyline vertices -> (4 * (N - 1), 3) VMobject points, one straight cubic per segment."""
+    vertices = np.asarray(vertices, dtype=float)
+    ends = np.stack([vertices[:-1], vertices[1:]], axis=1)
+    return (SHAFT_WEIGHTS @ ends).reshape(-1, 3)
+
+
+def quads_to_points(corners):
+    """(F, 4, 3) quad corners -> (F, 16, 3) VMobject points, straight edges."""
+    starts = corners
+    ends = np.roll(corners, -1, axis=1)
+    thirds = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+    points = starts[:, :, None, :] + thirds * (ends - starts)[:, :, None, :]
+    return points.reshape(len(corners), 16, 3)
+
+
+class PrismGrid(VGroup):
+    """The n x n Riemann prisms under a surface, built from one evaluation of func.
+
+    Cell (i, j) is centred on (u_min + i*du, v_min + j*dv) and is as tall as
+    ``func(u, v)[2]`` there, the same layout ``ThreeFunc`` got from ``n**2``
+    separate ``Prism`` objects. ``func`` is called once on the whole meshgrid,
+    so it has to be written with numpy operations.
+
+    With ``cull`` only faces that can be seen from above are generated: the
+    tops, and for each pair of neighbouring cells the strip of wall where one
+    sticks out above the other. That is roughly 3n^2 faces instead of 6n^2,
+    but it only looks the same when nothing shows through, so by default
+    (``cull=None``) it is on for opaque prisms only.
+
+    ``scale_factor``/``about_point`` place the grid straight into scene
+    coordinates, the same as calling ``scale`` afterwards but without another
+    pass over every face (or over whatever group the grid ends up in).
+    """
+
+    def __init__(self, func, n, u_range=(-2, 2), v_range=(-2, 2), cull=None, scale_factor=1, about_point=None,
+                 fill_color=BLUE, fill_opacity=0.75, stroke_width=0, **kwargs):
+        super().__init__(fill_color=fill_color, fill_opacity=fill_opacity, stroke_width=stroke_width, **kwargs)
+        self.n = n
+        self.du = (u_range[1] - u_range[0]) / n
+        self.dv = (v_range[1] - v_range[0]) / n
+        us = u_range[0] + np.arange(n) * self.du
+        vs = v_range[0] + np.arange(n) * self.dv
+        u, v = np.meshgrid(us, vs, indexing="ij")
+        self.heights = np.asarray(func(u, v)[2], dtype=float) * np.ones_like(u)
+        # cell edges, cell (i, j) spans ux[i]..ux[i+1] and vy[j]..vy[j+1]
+        self.ux = np.append(us - self.du / 2, us[-1] + self.du / 2)
+        self.vy = np.append(vs - self.dv / 2, vs[-1] + self.dv / 2)
+        if cull is None:
+            cull = fill_opacity >= 1
+        self.corners = self.get_face_corners(cull)
+        if scale_factor != 1:
+            about_point = np.zeros(3) if about_point is None else np.asarray(about_point, dtype=float)
+            self.corners = about_point + scale_factor * (self.corners - about_point)
+        faces = []
+        for points in quads_to_points(self.corners):
+            face = VMobject(shade_in_3d=True)
+            face.points = points
+            faces.append(face)
+        # added one at a time, each face would be looked up in all the ones before it
+        self.add(*faces)
+        self.set_fill(fill_color, fill_opacity)
+        self.set_stroke(fill_color, stroke_width)
+
+    def get_face_corners(self, cull=True):
+        n, h, ux, vy = self.n, self.heights, self.ux, self.vy
+        x0, y0 = np.meshgrid(ux[:-1], vy[:-1], indexing="ij")
+        x1, y1 = np.meshgrid(ux[1:], vy[1:], indexing="ij")
+
+        def quads(*corners):
+            return np.stack([np.stack(np.broadcast_arrays(*c), axis=-1).reshape(-1, 3) for c in corners], axis=1)
+
+        faces = [quads((x0, y0, h), (x1, y0, h), (x1, y1, h), (x0, y1, h))]
+        if cull:
+            # walls between neighbours (zero-height cells pad the outside)
+            padded = np.pad(h, 1)
+            lo_x = np.minimum(padded[:-1, 1:-1], padded[1:, 1:-1])
+            hi_x = np.maximum(padded[:-1, 1:-1], padded[1:, 1:-1])
+            wx, wy0 = np.meshgrid(ux, vy[:-1], indexing="ij")
+            wy1 = np.broadcast_to(vy[1:], wx.shape)
+            lo_y = np.minimum(padded[1:-1, :-1], padded[1:-1, 1:])
+            hi_y = np.maximum(padded[1:-1, :-1], padded[1:-1, 1:])
+            vx0, vwy = np.meshgrid(ux[:-1], vy, indexing="ij")
+            vx1 = np.broadcast_to(ux[1:, None], vwy.shape)
+            walls_x = quads((wx, wy0, lo_x), (wx, wy1, lo_x), (wx, wy1, hi_x), (wx, wy0, hi_x))
+            walls_y = quads((vx0, vwy, lo_y), (vx1, vwy, lo_y), (vx1, vwy, hi_y), (vx0, vwy, hi_y))
+            faces += [walls_x[(hi_x - lo_x).ravel() > 1e-9], walls_y[(hi_y - lo_y).ravel() > 1e-9]]
+        else:
+            zero = np.zeros_like(h)
+            faces += [
+                quads((x0, y0, zero), (x0, y1, zero), (x1, y1, zero), (x1, y0, zero)),
+                quads((x0, y0, zero), (x1, y0, zero), (x1, y0, h), (x0, y0, h)),
+                quads((x0, y1, zero), (x0, y1, h), (x1, y1, h), (x1, y1, zero)),
+                quads((x0, y0, zero), (x0, y0, h), (x0, y1, h), (x0, y1, zero)),
+                quads((x1, y0, zero), (x1, y1, zero), (x1, y1, h), (x1, y0, h)),
+            ]
+        return np.concatenate(faces)
+
+
+class GrowingCurve(ParametricFunction):
+    """A ParametricFunction sampled once over t_range and drawn up to ``set_t(t)``.
+
+    ``always_redraw(lambda: ParametricFunction(f, t_range=[0, t]))`` resamples
+    and re-smooths everything from t_min to t on every frame. Here the whole
+    curve is built once (pass ``use_vectorized=True`` if ``function`` takes an
+    array of t) and ``set_t`` only slices it: the segments before t are a view
+    of the stored points and the one t falls in is cut with
+    ``partial_bezier_points``.
+
+    ``shift``/``scale``/``rotate`` on the curve itself move the stored points as
+    well. Do not transform it through a group it is in: that only reaches the
+    revealed points and leaves the stored ones out of step. Discontinuities are
+    not supported.
+    """
+
+    def __init__(self, function, t_range, t=None, **kwargs):
+        self.full_points = None
+        super().__init__(function, t_range=t_range, **kwargs)
+        self.ts = np.array([*self.scaling.function(np.arange(self.t_min, self.t_max, self.t_step)),
+                            self.scaling.function(self.t_max)])
+        self.keep_full_points()
+        self.set_t(self.t_max if t is None else t)
+
+    def keep_full_points(self):
+        self.full_points = self.points
+        # set_t writes the partial segment in here and shows a prefix of it
+        self.buffer = self.points.copy()
+        self.open_segment = None
+
+    def set_t(self, t):
+        ts, full, buffer = self.ts, self.full_points, self.buffer
+        k = int(np.clip(np.searchsorted(ts, t, "right") - 1, 0, len(ts) - 2))
+        span = ts[k + 1] - ts[k]
+        alpha = float(np.clip((t - ts[k]) / span, 0, 1)) if span > 0 else 1.0
+        if self.open_segment is not None and self.open_segment != k:
+            j = self.open_segment
+            buffer[4 * j:4 * j + 4] = full[4 * j:4 * j + 4]
+        buffer[4 * k:4 * k + 4] = partial_bezier_points(full[4 * k:4 * k + 4], 0, alpha)
+        self.open_segment = k
+        self.t = t
+        self.points = buffer[:4 * k + 4]
+        return self
+
+    def transform_full_points(self, method, *args):
+        if self.full_points is None:
+            return method(*args)
+        self.points = self.full_points
+        method(*args)
+        self.keep_full_points()
+        return self.set_t(self.t)
+
+    def shift(self, *vectors):
+        return self.transform_full_points(super().shift, *vectors)
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        return self.transform_full_points(super().apply_points_function_about_point, func, about_point, about_edge)
+
+
+class MovingVector(Vector):
+    """A Vector that can be re-pointed in place, for updaters that follow a function.
+
+    ``m.become(Vector(...).shift(...))`` in an updater builds a new arrow, tip
+    and all, and deep-copies it into ``m`` on every frame. ``retarget`` writes
+    the new shaft and tip points straight into the arrays the vector already
+    has, with the same tip size and stroke width ``Vector`` would give an
+    arrow of that length. Only for vectors in the xy-plane with the default
+    triangle tip.
+    """
+
+    def __init__(self, direction=RIGHT, **kwargs):
+        super().__init__(direction, **kwargs)
+        self.ends = np.zeros((2, 3))
+        self.corners = np.zeros((3, 3))
+        self.retarget(self.get_start(), self.get_end())
+
+    @staticmethod
+    def writable_points(mob, n):
+        points = mob.points
+        if points.shape != (n, 3) or points.dtype != np.float64 or not points.flags.c_contiguous:
+            mob.points = points = np.zeros((n, 3))
+        return points
+
+    def retarget(self, start, end):
+        "Point the vector from start to end, rewriting its points in place."
+        ends, corners = self.ends, self.corners
+        ends[0] = start
+        corners[0] = end
+        direction = corners[0] - ends[0]
+        length = np.linalg.norm(direction)
+        unit = direction / length if length > 0 else direction
+        tip_length = min(self.tip_length, self.max_tip_length_to_length_ratio * length)
+        ends[1] = corners[0] - tip_length * unit
+        half_width = np.cross(OUT, unit) * (tip_length / 2)
+        corners[1] = ends[1] + half_width
+        corners[2] = ends[1] - half_width
+        np.dot(SHAFT_WEIGHTS, ends, out=self.writable_points(self, 4))
+        np.dot(TRIANGLE_WEIGHTS, corners, out=self.writable_points(self.tip, 12))
+        width = min(self.initial_stroke_width, self.max_stroke_width_to_length_ratio * length)
+        if width != self.stroke_width:
+            self.set_stroke(width=width, family=False)
+        return self
+
+
+class ColoredPolyline(VGroup):
+    """A polyline with a colour per segment, drawn up to ``reveal(k)`` segments.
+
+    Cairo strokes a path in a single colour, so each run of consecutive
+    segments that share one (a colormap only has so many, 256 for hsv) is one
+    submobject, its points a prefix view of the stored polyline. ``reveal``
+    only reassigns the runs between the old and the new end, and what is not
+    revealed yet is not drawn at all.
+
+    ``shift``/``scale``/``rotate`` on the polyline itself move every segment,
+    shown or not. Like GrowingCurve, do not transform it through a group it
+    is in.
+    """
+
+    def __init__(self, vertices, rgbas, shown=None, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        rgbas = np.asarray(rgbas, dtype=float)
+        self.full_points = segments_to_points(vertices)
+        self.n_segments = len(rgbas)
+        new_colour = np.any(rgbas[1:] != rgbas[:-1], axis=1)
+        self.run_starts = np.flatnonzero(np.r_[True, new_colour])
+        self.run_ends = np.r_[self.run_starts[1:], self.n_segments]
+        for rgba in rgbas[self.run_starts]:
+            self.add(VMobject(stroke_color=ManimColor(rgba), stroke_width=stroke_width))
+        self.shown = 0
+        self.reveal(self.n_segments if shown is None else shown)
+
+    def reveal(self, k):
+        "Show the first k segments."
+        k = int(np.clip(k, 0, self.n_segments))
+        lo, hi = sorted((self.shown, k))
+        # runs overlapping segments lo..hi are the only ones that change
+        first = np.searchsorted(self.run_ends, lo, "right")
+        last = np.searchsorted(self.run_starts, hi, "left")
+        for i in range(first, last):
+            start, end = self.run_starts[i], self.run_ends[i]
+            self.submobjects[i].points = self.full_points[4 * start:4 * min(max(k, start), end)]
+        self.shown = k
+        return self
+
+    # the runs show views of full_points, so transforming it in place moves them too
+    def shift(self, *vectors):
+        self.full_points += sum(vectors)
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+        self.full_points[:] = func(self.full_points - about_point) + about_point
+        return self
+
+
+class TimeVectorField(VGroup):
+    """ArrowVectorField of a field that moves with t, updated in place by ``set_t``.
+
+    ``always_redraw(lambda: ArrowVectorField(lambda p: func(p, t)))`` builds
+    every arrow again on each frame and calls func once per arrow. Here the
+    anchors are laid out once, on the grid ArrowVectorField uses, and
+    ``set_t`` calls ``func(points, t)`` once with all of them as an (N, 3)
+    array, then writes every shaft, tip and colour into preallocated arrays.
+    Arrow lengths, tips, stroke widths and colours follow ArrowVectorField.
+
+    ``scale_factor`` does what ``.scale(scale_factor)`` about the origin did
+    to the old field: anchors, shafts and tips grow, stroke widths do not.
+    """
+
+    def __init__(self, func, t=0, x_range=None, y_range=None, scale_factor=1,
+                 length_func=lambda norm: 0.45 * sigmoid(norm), colors=DEFAULT_SCALAR_FIELD_COLORS,
+                 min_color_scheme_value=0, max_color_scheme_value=2, stroke_width=6, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.length_func = length_func
+        self.scale_factor = scale_factor
+        self.rgbs = np.array([color_to_rgb(c) for c in colors])
+        self.color_range = (min_color_scheme_value, max_color_scheme_value)
+        self.max_stroke_width = stroke_width
+        ranges = []
+        for r, half in ((x_range, config["frame_width"] / 2), (y_range, config["frame_height"] / 2)):
+            start, stop, step = [*(r or [floor(-half), ceil(half)]), 0.5][:3]
+            ranges.append(np.arange(start, stop + step, step))
+        xs, ys = np.meshgrid(*ranges, indexing="ij")
+        self.anchors = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+
+        n = len(self.anchors)
+        self.ends = np.zeros((n, 2, 3))
+        self.corners = np.zeros((n, 3, 3))
+        self.shaft_points = np.zeros((n, 4, 3))
+        self.tip_points = np.zeros((n, 12, 3))
+        self.add(*[MovingVector(RIGHT, stroke_width=stroke_width) for _ in range(n)])
+        self.set_t(t)
+
+    def field_rgbs(self, norms):
+        # ArrowVectorField.pos_to_rgb for every norm at once
+        lo, hi = self.color_range
+        alpha = (np.clip(norms, lo, hi) - lo) / (hi - lo) * (len(self.rgbs) - 1)
+        i = alpha.astype(int)
+        c1 = self.rgbs[i]
+        c2 = self.rgbs[np.minimum(i + 1, len(self.rgbs) - 1)]
+        return c1 + (c2 - c1) * (alpha % 1)[:, None]
+
+    def set_t(self, t):
+        anchors = self.anchors
+        values = np.asarray(self.func(anchors, t), dtype=float)
+        norms = np.linalg.norm(values, axis=1)
+        lengths = np.where(norms > 0, self.length_func(norms), 0)
+        units = np.divide(values, norms[:, None], out=np.zeros_like(values), where=norms[:, None] > 0)
+        tips = np.minimum(DEFAULT_ARROW_TIP_LENGTH, 0.25 * lengths)[:, None]
+
+        ends, corners = self.ends, self.corners
+        ends[:, 0] = anchors
+        np.multiply(units, (lengths[:, None] - tips), out=ends[:, 1])
+        ends[:, 1] += anchors
+        half_widths = np.cross(OUT, units) * (tips / 2)
+        np.add(ends[:, 1], units * tips, out=corners[:, 0])
+        np.add(ends[:, 1], half_widths, out=corners[:, 1])
+        np.subtract(ends[:, 1], half_widths, out=corners[:, 2])
+        np.matmul(SHAFT_WEIGHTS, ends, out=self.shaft_points)
+        np.matmul(TRIANGLE_WEIGHTS, corners, out=self.tip_points)
+        if self.scale_factor != 1:
+            self.shaft_points *= self.scale_factor
+            self.tip_points *= self.scale_factor
+
+        widths = np.minimum(self.max_stroke_width, 5 * lengths)
+        rgbs = self.field_rgbs(norms)
+        # animations swap in arrays of their own, so point the arrows back at ours
+        for arrow, shaft, tip, width, rgb in zip(self.submobjects, self.shaft_points, self.tip_points, widths, rgbs):
+            arrow.points = shaft
+            arrow.tip.points = tip
+            arrow.stroke_width = width
+            for mob in (arrow, arrow.tip):
+                mob.fill_rgbas[:, :3] = rgb
+                mob.stroke_rgbas[:, :3] = rgb
+        self.t = t
+        return self
+
+
+class ParticleFlow(PMobject):
+    """n particles carried along by ``func(points, t)``, drawn as one point cloud with trails.
+
+    ``step(dt, t)`` moves every particle at once with an RK4 step over dt
+    seconds of scene time while the field's own t goes from the previous
+    value to the new one, so it can follow the same ValueTracker as a
+    TimeVectorField of func. The last ``trail`` positions of each particle
+    are kept in a ring buffer and drawn oldest first. Point clouds are
+    written into the frame without blending, so the trail fades by mixing
+    ``color`` into ``background`` rather than through alpha.
+
+    Particles that leave x_range/y_range or get older than ``lifetime``
+    seconds start again at a random point; their ages start staggered so
+    that does not happen to all of them at once.
+    """
+
+    def __init__(self, func, n=2000, t=0, x_range=(-4, 4), y_range=(-2.25, 2.25), trail=12, speed=1.0,
+                 lifetime=3.0, scale_factor=1, color=WHITE, background=BLACK, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.func = func
+        self.t = t
+        self.speed = speed
+        self.lifetime = lifetime
+        self.scale_factor = scale_factor
+        self.low = np.array([x_range[0], y_range[0]])
+        self.high = np.array([x_range[1], y_range[1]])
+
+        # np.random, not a Generator, so segments' per-scene seed applies
+        self.positions = self.random_points(n)
+        self.ages = np.random.uniform(0, lifetime, n)
+        self.history = np.repeat(self.positions[None], trail, axis=0)
+        self.head = 0
+        fade = np.linspace(1 / trail, 1, trail)[:, None]
+        rgbs = color_to_rgb(background) + fade * (color_to_rgb(color) - color_to_rgb(background))
+        self.rgbas = np.repeat(np.c_[rgbs, np.ones(trail)], n, axis=0)
+        self.update_points()
+
+    def random_points(self, k):
+        xy = np.random.uniform(self.low, self.high, (k, 2))
+        return np.c_[xy, np.zeros(k)]
+
+    def velocity(self, points, t):
+        return self.speed * np.asarray(self.func(points, t), dtype=float)
+
+    def step(self, dt, t=None):
+        "Advance every particle by dt seconds while the field goes from self.t to t."
+        t0, t1 = self.t, (self.t if t is None else t)
+        self.t = t1
+        if dt == 0:
+            return self
+        p = self.positions
+        k1 = self.velocity(p, t0)
+        k2 = self.velocity(p + dt / 2 * k1, (t0 + t1) / 2)
+        k3 = self.velocity(p + dt / 2 * k2, (t0 + t1) / 2)
+        k4 = self.velocity(p + dt * k3, t1)
+        p += dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        self.ages += dt
+        dead = (self.ages > self.lifetime) | np.any((p[:, :2] < self.low) | (p[:, :2] > self.high), axis=1)
+        if dead.any():
+            p[dead] = self.random_points(np.count_nonzero(dead))
+            self.ages[dead] = 0
+            # collapse the trail, or it would streak across to the new spot
+            self.history[:, dead] = p[dead]
+        self.head = (self.head + 1) % len(self.history)
+        self.history[self.head] = p
+        return self.update_points()
+
+    def update_points(self):
+        # oldest slot of the ring first, matching the fade in rgbas
+        order = (np.arange(len(self.history)) + self.head + 1) % len(self.history)
+        self.points = self.history[order].reshape(-1, 3) * self.scale_factor
+        return self
+
+
+class LpBall(VMobject):
+    """The boundary |x|^p + |y|^p = 1 of the p-norm unit ball, scaled to ``radius``.
+
+    Sampled in polar form, r(phi) = (|cos phi|^p + |sin phi|^p)^(-1/p), at n
+    fixed angles. With n a multiple of 8 these include the axes and the
+    diagonals, so the corners of p = 1 and of the max-norm square are hit
+    exactly. ``set_p`` is one numpy expression over those angles;
+    p >= ``max_p`` draws the square, as Lp's implicit function did past 90.
+    """
+
+    def __init__(self, p=2, radius=1, n=720, max_p=90, **kwargs):
+        self.radius = radius
+        self.max_p = max_p
+        phi = np.linspace(0, 2 * np.pi, n + 1)
+        self.directions = np.stack([np.cos(phi), np.sin(phi), np.zeros_like(phi)], axis=1)
+        super().__init__(**kwargs)
+        self.set_p(p)
+
+    def set_p(self, p):
+        c, s = np.abs(self.directions[:, 0]), np.abs(self.directions[:, 1])
+        norms = np.maximum(c, s) if p >= self.max_p else (c ** p + s ** p) ** (1 / p)
+        self.points = segments_to_points(self.directions * (self.radius / norms)[:, None])
+        self.p = p
+        return self
+
+
+class LpBoundaryPath:
+    """Walks the boundary of an LpBall with one parameter u, for dots that ride on it.
+
+    u in [-1, 1] runs along the top half from left to right (x = radius * u),
+    u in [1, 3] comes back along the bottom half, and on the max-norm square
+    u < -1 carries on down the left side. ``points`` takes an array of u;
+    ``point`` is the single-value version and caches what it has computed
+    per (p, u), so updaters that ask again while nothing moves are a lookup.
+    """
+
+    def __init__(self, radius=1, center=ORIGIN, max_p=90):
+        self.radius = radius
+        self.center = np.asarray(center, dtype=float)
+        self.max_p = max_p
+        self.cache = {}
+
+    def points(self, us, p):
+        us = np.asarray(us, dtype=float)
+        top = us <= 1
+        # top half at u, bottom half mirrored at 2 - u
+        v = np.where(top, us, 2 - us)
+        x = np.where(us < -1, -self.radius, self.radius * v)
+        if p >= self.max_p:
+            y = np.where(v > -1, self.radius, self.radius - np.abs(v + 1))
+        else:
+            y = self.radius * np.maximum(1 - np.abs(v) ** p, 0) ** (1 / p)
+        y = np.where(top, y, -y)
+        return self.center + np.stack([x, y, np.zeros_like(x)], axis=-1)
+
+    def point(self, u, p):
+        key = (p, u)
+        if key not in self.cache:
+            if len(self.cache) > 4096:
+                self.cache.clear()
+            point = self.points(u, p)
+            point.setflags(write=False)
+            self.cache[key] = point
+        return self.cache[key]
+
+
+class ImplicitContour(VMobject):
+    """func(x, y) = level on a grid sampled once, for animations that move the level.
+
+    ImplicitFunction redoes its adaptive contouring whenever it is rebuilt.
+    Here func is evaluated once, vectorised over a resolution x resolution
+    grid, and ``set_level`` only re-thresholds that grid (marching squares
+    from contourpy, which matplotlib already depends on). The contour is
+    drawn as straight segments between grid crossings.
+    """
+
+    def __init__(self, func, level=0, x_range=None, y_range=None, resolution=400, **kwargs):
+        import contourpy  # only the scenes that build one pay for the import
+
+        self.x_range = x_range or [-config["frame_width"] / 2, config["frame_width"] / 2]
+        self.y_range = y_range or [-config["frame_height"] / 2, config["frame_height"] / 2]
+        xs = np.linspace(*self.x_range[:2], resolution)
+        ys = np.linspace(*self.y_range[:2], resolution)
+        x, y = np.meshgrid(xs, ys)
+        self.field = np.asarray(func(x, y), dtype=float)
+        self.contours = contourpy.contour_generator(xs, ys, self.field)
+        super().__init__(**kwargs)
+        self.set_level(level)
+
+    def set_level(self, level):
+        subpaths = []
+        for line in self.contours.lines(level):
+            # contourpy repeats a vertex where the contour passes through a grid point
+            line = line[np.r_[True, np.any(line[1:] != line[:-1], axis=1)]]
+            if len(line) > 1:
+                subpaths.append(segments_to_points(np.c_[line, np.zeros(len(line))]))
+        self.points = np.concatenate(subpaths) if subpaths else np.zeros((0, 3))
+        self.level = level
+        return self
@@ -0,0 +1,275 @@
+"""Scrub through a scene at low resolution, see any moment of it at full quality.
+
+    python preview.py ParameterisedCurve1          # timing of a high quality render
+    python preview.py LpLI -q m --scale 0.2 --fps 8
+
+First the scene runs once like a dry run (dryrun.py), stepping every frame at
+the frame rate of the chosen quality, but every 1/--fps seconds of scene time
+it also draws a picture at --scale of the full resolution. Those pictures are
+what the time slider and the play button show, so scrubbing and playback
+cost nothing, and playback drops pictures rather than falling behind.
+
+When the slider rests, the scene runs again without pixels up to that moment
+and that one frame is drawn at full resolution. The ValueTrackers the scene's
+updaters and attributes reach (t_tracker, slider.t_tracker, h...) then get
+sliders of their own over the range they sweep in the scene. Moving one sets
+the tracker and runs the updaters, exactly as the scene's own animations do.
+"""
+import argparse
+import importlib
+import time
+
+import numpy as np
+from manim import Mobject, Scene, ValueTracker, tempconfig
+from manim.constants import QUALITIES as MANIM_QUALITIES
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+
+from dryrun import DryRunRenderer, camera_class_of
+from render import QUALITIES, discover
+
+
+def find_trackers(scene):
+    "name -> ValueTracker for the trackers on the scene and in the closures of its updaters."
+    found = {}
+
+    def consider(name, value):
+        if isinstance(value, ValueTracker):
+            found.setdefault(id(value), (name, value))
+
+    def walk(func, depth=0):
+        func = getattr(func, "func", func)
+        code, cells = getattr(func, "__code__", None), getattr(func, "__closure__", None) or ()
+        if code is None:
+            return
+        for name, cell in zip(code.co_freevars, cells):
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            consider(name, value)
+            if callable(value) and depth < 2:
+                walk(value, depth + 1)  # lambda t: updater(t, refFrame, DIRE)
+            elif not isinstance(value, (Mobject, Scene)) and hasattr(value, "__dict__"):
+                for attr, item in vars(value).items():
+                    consider(f"{name}.{attr}", item)  # slider.t_tracker
+
+    for attr, value in vars(scene).items():
+        consider(f"self.{attr}", value)
+    for mob in [m for top in scene.mobjects for m in top.get_family()]:
+        for updater in mob.updaters:
+            walk(updater)
+    for updater in scene.updaters:
+        walk(updater)
+    return {name: tracker for name, tracker in found.values()}
+
+
+class PreviewRenderer(DryRunRenderer):
+    "A dry run that keeps a picture every 1/keep_fps seconds and can stop the scene at stop_at."
+
+    def __init__(self, keep_fps=None, stop_at=None, **kwargs):
+        super().__init__(**kwargs)
+        self.keep_fps = keep_fps
+        self.stop_at = stop_at
+        self.kept = []  # (scene time, pixels, {tracker name: value})
+
+    def init_scene(self, scene, *args, **kwargs):
+        super().init_scene(scene, *args, **kwargs)
+        self.scene = scene
+
+    def draw(self, scene):
+        CairoRenderer.update_frame(self, scene)
+        return np.array(self.camera.pixel_array)
+
+    def keep(self, scene):
+        "Fill every preview tick up to now with the current picture."
+        if self.keep_fps is None:
+            return
+        image = values = None
+        while len(self.kept) <= self.time * self.keep_fps:
+            if image is None:
+                image = self.draw(scene)
+                values = {name: tracker.get_value() for name, tracker in find_trackers(scene).items()}
+            self.kept.append((len(self.kept) / self.keep_fps, image, values))
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        self.keep(scene)
+        if self.stop_at is not None and self.time >= self.stop_at:
+            raise EndSceneEarlyException()
+
+    def freeze_current_frame(self, duration):
+        if self.stop_at is not None and self.time + duration >= self.stop_at:
+            self.time = self.stop_at
+            raise EndSceneEarlyException()
+        super().freeze_current_frame(duration)
+        # nothing moves during a static wait, one picture serves all of it
+        self.keep(self.scene)
+
+
+def config_for(quality, scale=1.0):
+    "tempconfig options: the frame rate of `quality`, its resolution times `scale`, no output."
+    target = MANIM_QUALITIES[QUALITIES[quality]]
+    return {
+        "quality": QUALITIES[quality],
+        "pixel_width": max(2, round(target["pixel_width"] * scale)),
+        "pixel_height": max(2, round(target["pixel_height"] * scale)),
+        "dry_run": True,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+
+
+def run(name, options, keep_fps=None, stop_at=None, module_name="scene"):
+    "Run scene `name` pixel-free under `options`, returns (scene, renderer) as they are when it ends or stops."
+    module = importlib.import_module(module_name)  # outside tempconfig, so its config changes stick
+    with tempconfig(options):
+        scene_class = getattr(module, name)
+        renderer = PreviewRenderer(camera_class=camera_class_of(scene_class), keep_fps=keep_fps, stop_at=stop_at)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return scene, renderer
+
+
+class Preview:
+    def __init__(self, name, quality="h", scale=0.25, fps=10):
+        self.name, self.quality = name, quality
+        self.full = config_for(quality)
+        start = time.perf_counter()
+        _, renderer = run(name, config_for(quality, scale), keep_fps=fps)
+        self.times = np.array([t for t, _, _ in renderer.kept])
+        self.images = [image for _, image, _ in renderer.kept]
+        self.values = [values for _, _, values in renderer.kept]
+        self.duration = renderer.time
+        print(f"{name}: {self.duration:.1f}s, {len(self.images)} preview frames in {time.perf_counter() - start:.1f}s")
+        self.live = None  # (scene, renderer) stopped at the refined moment
+        self.playing = None
+        self.tracker_sliders = []
+
+    def index_at(self, t):
+        return int(np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, len(self.times) - 1))
+
+    def ranges(self):
+        "Per tracker, the (min, max) it takes over the preview frames."
+        spans = {}
+        for values in self.values:
+            for name, value in values.items():
+                low, high = spans.get(name, (value, value))
+                spans[name] = (min(low, value), max(high, value))
+        return spans
+
+    def refine(self, t):
+        "Full quality frame at scene time t, keeps the stopped scene around for the tracker sliders."
+        scene, renderer = run(self.name, self.full, stop_at=max(t, 1e-9))
+        self.live = scene, renderer
+        with tempconfig(self.full):
+            return renderer.draw(scene)
+
+    def drive(self, name, value):
+        scene, renderer = self.live
+        find_trackers(scene)[name].set_value(value)
+        with tempconfig(self.full):
+            scene.update_mobjects(0)
+            return renderer.draw(scene)
+
+    def show(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Button, Slider
+
+        fig = plt.figure(self.name, figsize=(10, 7.5))
+        ax = fig.add_axes([0.02, 0.3, 0.96, 0.68])
+        ax.set_axis_off()
+        picture = ax.imshow(self.images[0])
+        label = fig.text(0.02, 0.26, "", family="monospace", fontsize=9)
+        scrub = Slider(fig.add_axes([0.12, 0.21, 0.7, 0.03]), "time", 0, self.duration, valinit=0)
+        play = Button(fig.add_axes([0.85, 0.2, 0.1, 0.05]), "play")
+        settle = fig.canvas.new_timer(interval=400)
+        settle.single_shot = True
+        tick = fig.canvas.new_timer(interval=int(1000 / 30))
+
+        def show_preview(t):
+            i = self.index_at(t)
+            picture.set_data(self.images[i])
+            values = "  ".join(f"{name}={value:.4g}" for name, value in self.values[i].items())
+            label.set_text(f"t={t:6.2f}s  preview  {values}")
+            fig.canvas.draw_idle()
+
+        def clear_tracker_sliders():
+            for slider in self.tracker_sliders:
+                slider.ax.remove()
+            self.tracker_sliders = []
+
+        def on_scrub(t):
+            show_preview(t)
+            if self.playing is None:
+                clear_tracker_sliders()
+                settle.stop()
+                settle.start()
+
+        def on_settle():
+            t = scrub.val
+            picture.set_data(self.refine(t))
+            label.set_text(f"t={t:6.2f}s  full quality")
+            clear_tracker_sliders()
+            spans = self.ranges()
+            trackers = find_trackers(self.live[0])
+            for row, (name, tracker) in enumerate(sorted(trackers.items())[:5]):
+                low, high = spans.get(name, (tracker.get_value() - 1, tracker.get_value() + 1))
+                if high <= low:
+                    low, high = low - 1, high + 1
+                slider = Slider(fig.add_axes([0.12, 0.15 - 0.035 * row, 0.7, 0.025]), name[:14], low, high,
+                                valinit=tracker.get_value())
+                slider.on_changed(lambda value, name=name: on_drive(name, value))
+                self.tracker_sliders.append(slider)
+            fig.canvas.draw_idle()
+
+        def on_drive(name, value):
+            picture.set_data(self.drive(name, value))
+            label.set_text(f"t={scrub.val:6.2f}s  full quality  {name}={value:.4g}")
+            fig.canvas.draw_idle()
+
+        def on_tick():
+            start_wall, start_t = self.playing
+            t = start_t + time.perf_counter() - start_wall
+            if t >= self.duration:
+                toggle(None)
+                t = self.duration
+            # whatever frame is due now, frames we were too slow for are skipped
+            scrub.set_val(t)
+
+        def toggle(_):
+            if self.playing is None:
+                start = 0 if scrub.val >= self.duration else scrub.val
+                self.playing = time.perf_counter(), start
+                clear_tracker_sliders()
+                play.label.set_text("pause")
+                tick.start()
+            else:
+                self.playing = None
+                tick.stop()
+                play.label.set_text("play")
+                settle.start()
+
+        settle.add_callback(on_settle)
+        tick.add_callback(on_tick)
+        scrub.on_changed(on_scrub)
+        play.on_clicked(toggle)
+        show_preview(0)
+        plt.show()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h", help="frame rate and full resolution")
+    parser.add_argument("--scale", type=float, default=0.25, help="preview resolution relative to the full one")
+    parser.add_argument("--fps", type=float, default=10, help="preview pictures per second of scene time")
+    args = parser.parse_args()
+    if args.scene not in discover():
+        parser.error(f"unknown scene: {args.scene}")
+    Preview(args.scene, args.quality, args.scale, args.fps).show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Render every Scene in scene.py in parallel and drop the results into static/.
+
+    python render.py                  # all scenes, high quality
+    python render.py Lp LpLI -q l     # just these, low quality
+    python render.py -j 4             # cap the pool at 4 workers
+
+Scenes listed in OUTPUTS are copied to the path the Hugo content embeds;
+anything else is left in manim's media directory.
+
+A scene is skipped when its fingerprint (its own source, the source of every
+helper in OWN_MODULES it reaches, the source of segments.py and texcache.py,
+the TeX preamble and the render settings)
+matches the one recorded in MANIFEST for an output that still exists. Pass
+--force to render anyway.
+"""
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+STATIC = ROOT / "static"
+MEDIA = ROOT / "media"
+MANIFEST = STATIC / "anim" / ".renders.json"
+
+# modules whose functions and classes count as part of a scene's source
+OWN_MODULES = {"scene", "util", "mobjects", "colormap", "textransform"}
+
+# modules scene.py installs into manim, every scene depends on all of their source
+INSTALLED = ("segments", "texcache")
+
+# scene name -> file under static/ that content/ references
+OUTPUTS = {
+    "ThreeFunc": "anim/ThreeFunc.mp4",
+    "VF": "anim/VF.mp4",
+    "VFScene": "anim/mvchap1/CircleVF.mp4",
+    "ParameterisedCurve1": "anim/mvchap1/ParameterisedCurve1.mp4",
+    "TangentVectorParametric": "anim/mvchap1/TangentVectorParametric.mp4",
+    "NormalVector1": "anim/mvchap1/NormalVecPerpendicular.mp4",
+    "ArcLengthFormula": "anim/mvchap1/ArcLengthFormula.mp4",
+    "ShoelaceFormula": "anim/mvchap1/shoelace.png",
+    "ArcLength56": "anim/mvchap1/chap2/al56.png",
+    "PictureScene": "anim/im/proj1.png",
+    "CrossProductScene": "anim/im/crossprod1.png",
+    "TriangleInequality": "anim/nmt/ch1/trineq.png",
+    "Lp": "anim/nmt/ch1/Lp.mp4",
+    "LpLI": "anim/nmt/ch1/LpLI.mp4",
+}
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def discover(module_name="scene"):
+    "Names of the Scene subclasses defined (not just imported) in module_name, in source order."
+    from manim import Scene
+
+    module = importlib.import_module(module_name)
+    scenes = [
+        cls for cls in vars(module).values()
+        if inspect.isclass(cls) and issubclass(cls, Scene) and cls.__module__ == module.__name__
+        and cls.construct is not Scene.construct
+    ]
+    scenes.sort(key=lambda cls: inspect.getsourcelines(cls)[1])
+    return [cls.__name__ for cls in scenes]
+
+
+def fingerprint(name, quality="h", module_name="scene"):
+    "Hash of everything that can change what scene `name` renders to."
+    import manim
+    import numpy as np
+    import texcache
+
+    module = importlib.import_module(module_name)
+    own = OWN_MODULES | {module.__name__}
+    hasher = hashlib.sha256()
+
+    def feed(text):
+        hasher.update(text.encode())
+        hasher.update(b"\0")
+
+    feed(f"{manim.__version__} {QUALITIES[quality]} {OUTPUTS.get(name)}")
+    feed(texcache.preamble_hash(manim.config.tex_template))
+    for helper in INSTALLED:
+        feed(inspect.getsource(importlib.import_module(helper)))
+
+    # walk every global the source mentions, in the module that defines it, following our own helpers
+    pending, seen = [getattr(module, name)], set()
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        source = inspect.getsource(obj)
+        feed(source)
+        namespace = vars(sys.modules[obj.__module__])
+        for ident in sorted(set(re.findall(r"[A-Za-z_]\w*", source))):
+            value = namespace.get(ident)
+            if (inspect.isfunction(value) or inspect.isclass(value)) and value.__module__ in own:
+                pending.append(value)
+            elif type(value).__module__ in own:
+                # instances like colormap.RAINBOW: their class plus their repr
+                pending.append(type(value))
+                feed(f"{ident}={value!r}")
+            elif isinstance(value, (str, int, float, tuple, list)) and ident not in vars(manim):
+                feed(f"{ident}={value!r}")
+            elif isinstance(value, np.ndarray) and ident not in vars(manim):
+                # tables like mobjects.SHAFT_WEIGHTS, repr would elide big ones
+                feed(f"{ident}={value.tolist()!r}")
+    return hasher.hexdigest()[:16]
+
+
+def load_manifest():
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_manifest(manifest):
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def stale(names, quality="h", module_name="scene"):
+    "Split names into (to render, up to date) and return the fresh fingerprints."
+    manifest = load_manifest()
+    prints = {name: fingerprint(name, quality, module_name) for name in names}
+    todo, fresh = [], []
+    for name in names:
+        entry = manifest.get(name)
+        if entry and entry["fingerprint"] == prints[name] and (ROOT / entry["output"]).exists():
+            fresh.append(name)
+        else:
+            todo.append(name)
+    return todo, fresh, prints
+
+
+def written(writer):
+    "The file a render produced, its movie or its still, whichever it wrote last."
+    paths = []
+    for attr in ("movie_file_path", "image_file_path"):
+        try:
+            paths.append(Path(getattr(writer, attr)))
+        except AttributeError:  # not part of this render's output plan
+            pass
+    paths = [path for path in paths if path.exists()]
+    if not paths:
+        raise FileNotFoundError("the render wrote neither a movie nor a still")
+    # an earlier render may have left the other one behind
+    return max(paths, key=lambda path: path.stat().st_mtime_ns)
+
+
+def render_one(name, quality="h", module_name="scene", publish=True, overrides=None):
+    """Render one scene in this process, returns (name, seconds, output path).
+
+    overrides is merged into the manim config used for the render. With
+    publish=False the result stays in MEDIA instead of replacing the copy
+    under STATIC.
+    """
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    target = OUTPUTS.get(name)
+    options = {
+        "quality": QUALITIES[quality],
+        "media_dir": str(MEDIA),
+        # latex cleans its output directory after each compile, keep workers apart
+        "tex_dir": str(MEDIA / "Tex" / name),
+        # only what a target needs, else manim's auto: a movie, or the last frame when nothing plays
+        "format": Path(target).suffix[1:] if target else "auto",
+        "disable_caching": False,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    options.update(overrides or {})
+    with tempconfig(options):
+        scene = getattr(importlib.import_module(module_name), name)()
+        scene.render()
+        output = written(scene.renderer.file_writer)
+    if publish and target is not None:
+        dest = STATIC / target
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, dest)
+        output = dest
+    return name, time.perf_counter() - start, output
+
+
+def render_all(names, quality="h", jobs=None, module_name="scene"):
+    if not names:
+        return {}
+    jobs = jobs or os.cpu_count() or 1
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+        futures = {pool.submit(render_one, name, quality, module_name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                _, elapsed, output = future.result()
+            except Exception as e:
+                print(f"{name:<26} FAILED  {type(e).__name__}: {e}")
+                results[name] = None
+                continue
+            print(f"{name:<26} {elapsed:7.1f}s  {output}")
+            results[name] = (elapsed, output)
+    print(f"{len(names)} scenes in {time.perf_counter() - start:.1f}s on {min(jobs, len(names))} workers")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="scene class names, default all")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes, default one per core")
+    parser.add_argument("--list", action="store_true", help="print the discovered scenes and exit")
+    parser.add_argument("--force", action="store_true", help="render even if the manifest says up to date")
+    args = parser.parse_args()
+
+    names = discover()
+    if args.list:
+        for name in names:
+            print(f"{name:<26} {OUTPUTS.get(name, '-')}")
+        return
+    unknown = set(args.scenes) - set(names)
+    if unknown:
+        parser.error(f"unknown scenes: {', '.join(sorted(unknown))}")
+    names = args.scenes or names
+    todo, fresh, prints = stale(names, args.quality)
+    if args.force:
+        todo, fresh = names, []
+    for name in fresh:
+        print(f"{name:<26} up to date")
+
+    results = render_all(todo, args.quality, args.jobs)
+    manifest = load_manifest()
+    for name, result in results.items():
+        if result is not None:
+            manifest[name] = {"fingerprint": prints[name], "output": os.path.relpath(result[1], ROOT)}
+    save_manifest(manifest)
+
+
+if __name__ == "__main__":
+    main()
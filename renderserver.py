@@ -0,0 +1,155 @@
+"""Keep manim imported between renders while iterating on a scene.
+
+    python renderserver.py serve -j 2            # start the server, two warm workers
+    python renderserver.py NormalVector1 -q l    # render through it, prints where the output went
+    python renderserver.py VF Lp --publish       # copy to static/ like render.py does
+
+The server imports scene.py (and with it manim, numpy and the TeX template)
+once, then forks its worker pool up front, so every worker starts warm. Jobs come in
+as JSON lines over a localhost socket. Before each job a worker checks the
+files of the modules in RELOAD and reloads them all, in that order, if any
+changed since it last looked, so edits to scene.py or its helpers show up
+without restarting anything.
+
+The segment cache, the TeX cache and the render settings are the same as
+render.py's; the manifest is not touched, so a later render.py run still
+decides on its own what is stale.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from render import QUALITIES, render_one
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("RENDERSERVER_PORT", 8765))
+
+# helpers before the modules that import them, scene.py last
+RELOAD = ["util", "colormap", "textransform", "mobjects", "scene"]
+
+_mtimes = {}
+
+
+def source_mtimes():
+    return {name: Path(sys.modules[name].__file__).stat().st_mtime_ns for name in RELOAD if name in sys.modules}
+
+
+def warm():
+    "Import everything a render needs: in the server before the pool forks, in a worker only if it was not forked."
+    if "scene" not in sys.modules:
+        importlib.import_module("scene")
+        _mtimes.update(source_mtimes())
+
+
+def reload_changed():
+    "Reload RELOAD if any of its files changed since the last job in this worker, returns whether it did."
+    current = source_mtimes()
+    if current == _mtimes:
+        return False
+    for name in RELOAD:
+        if name in sys.modules:
+            importlib.reload(sys.modules[name])
+    _mtimes.clear()
+    _mtimes.update(source_mtimes())
+    return True
+
+
+def render_job(name, quality, publish):
+    reloaded = reload_changed()
+    name, seconds, output = render_one(name, quality, publish=publish)
+    return {"scene": name, "seconds": seconds, "output": str(output), "reloaded": reloaded}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    "One JSON request line {scenes, quality, publish}, one JSON line back per scene as it finishes."
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        pool = self.server.pool
+        futures = {pool.submit(render_job, name, request.get("quality", "l"), request.get("publish", False)): name
+                   for name in request["scenes"]}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"scene": futures[future], "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(result) + "\n").encode())
+            self.wfile.flush()
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def serve(jobs=None, port=PORT, max_jobs_per_worker=None):
+    warm()
+    jobs = jobs or os.cpu_count() or 1
+    # forked workers inherit the imported modules, elsewhere (or when workers get
+    # replaced, which cannot fork) the initializer imports them once per worker
+    fork = "fork" in multiprocessing.get_all_start_methods() and max_jobs_per_worker is None
+    context = multiprocessing.get_context("fork" if fork else "spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=warm,
+                             max_tasks_per_child=max_jobs_per_worker) as pool:
+        # start every worker now, before there are handler threads around to fork with
+        for future in [pool.submit(warm) for _ in range(jobs)]:
+            future.result()
+        with RenderServer((HOST, port), Handler) as server:
+            server.pool = pool
+            print(f"render server on {HOST}:{port}, {jobs} workers")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+def submit(scenes, quality="l", publish=False, port=PORT):
+    "Send one job to a running server and yield its results as they arrive."
+    with socket.create_connection((HOST, port)) as conn:
+        conn.sendall((json.dumps({"scenes": scenes, "quality": quality, "publish": publish}) + "\n").encode())
+        with conn.makefile(encoding="utf-8") as replies:
+            for _ in scenes:
+                line = replies.readline()
+                if not line:
+                    break
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="+", help="'serve', or scene class names to render")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="server: worker processes, default one per core")
+    parser.add_argument("--max-jobs-per-worker", type=int, default=None,
+                        help="server: replace a worker after this many renders")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--publish", action="store_true", help="copy outputs to their place under static/")
+    args = parser.parse_args()
+
+    if args.scenes == ["serve"]:
+        serve(args.jobs, args.port, args.max_jobs_per_worker)
+        return
+    try:
+        results = list(submit(args.scenes, args.quality, args.publish, args.port))
+    except ConnectionRefusedError:
+        parser.error(f"no render server on {HOST}:{args.port}, start one with: python renderserver.py serve")
+    failed = False
+    for result in results:
+        if "error" in result:
+            failed = True
+            print(f"{result['scene']:<26} FAILED  {result['error']}")
+        else:
+            note = "  (reloaded)" if result["reloaded"] else ""
+            print(f"{result['scene']:<26} {result['seconds']:7.1f}s  {result['output']}{note}")
+    sys.exit(failed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
+import itertools as it
 import random
 
 import numpy as np
 from manim import *
 
 from util import pairwise
+from colormap import RAINBOW, Colormap
+from textransform import TexTransformPlan
+from mobjects import (ColoredPolyline, GrowingCurve, LpBall, LpBoundaryPath, MovingVector, ParticleFlow, PrismGrid,
+                      TimeVectorField)
 from math import sqrt
+import segments
+import texcache
 
 COL = "#2a2c40"
 config.background_color = COL
@@ -80,7 +87,11 @@ textemp = r"""\usepackage{xcolor}
 \usepackage{stackengine}
 \newcommand{\longdiv}{\smash{\mkern-0.43mu\vstretch{1.31}{\hstretch{.7}{)}}\mkern-5.2mu\vstretch{1.31}{\hstretch{.7}{)}}}}"""
 
-config.tex_template.add_to_preamble(textemp)
+# attach once, a reload of this module (render server, --list) must not stack copies
+if textemp not in config.tex_template.preamble:
+    config.tex_template.add_to_preamble(textemp)
+texcache.install()
+segments.install()
 
 
 class RS(Scene):
@@ -114,8 +125,60 @@ class RS(Scene):
 
 
 class MyCamera(ThreeDCamera):
+    projected = {}  # id(mobject) -> (its points, projected points) for the frame being drawn
+    fixed_tags = 0  # bumped by make_fixed
+    partition_key = None
+    moving, fixed_ids = [], frozenset()
+
+    def partition(self, mobjects):
+        "The mobjects that get projected, redone only when the mobjects or what is fixed change."
+        key = (tuple(map(id, mobjects)), MyCamera.fixed_tags, len(self.fixed_in_frame_mobjects),
+               len(self.fixed_orientation_mobjects))
+        if key != self.partition_key:
+            # make_fixed tags with an attribute rather than a set so that copies made by
+            # Transform/FadeTransform stay fixed too
+            self.fixed_ids = {id(m) for m in mobjects if getattr(m, "fixed", False)}
+            self.moving = [m for m in mobjects if id(m) not in self.fixed_ids and m not in self.fixed_in_frame_mobjects
+                           and m not in self.fixed_orientation_mobjects]
+            # holding on to the list keeps its ids from being reused by new mobjects
+            self.partition_key, self.partition_mobjects = key, mobjects
+        return self.moving
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        # ThreeDCamera sorts and projects mobject by mobject; with hundreds of prism faces
+        # it's much cheaper to do the depth keys and the projection over all points at once
+        self.reset_rotation_matrix()
+        mobjects = super(ThreeDCamera, self).get_mobjects_to_display(mobjects, **kwargs)
+        moving = self.partition(mobjects)
+        depths = {}
+        if moving:
+            points = np.concatenate([m.points for m in moving])
+            starts = np.cumsum([0] + [len(m.points) for m in moving[:-1]])
+            centers = (np.minimum.reduceat(points, starts) + np.maximum.reduceat(points, starts)) / 2
+            depths = dict(zip(map(id, moving), centers @ self.get_rotation_matrix()[2]))
+            # non-finite points go through the usual per-mobject path, which blanks them
+            if np.isfinite(points).all():
+                projected = np.split(self.project_points(points), starts[1:])
+                self.projected = {id(m): (m.points, p) for m, p in zip(moving, projected)}
+
+        def z_key(mob):
+            if not getattr(mob, "shade_in_3d", False):
+                return np.inf
+            if mob.submobjects or getattr(mob, "z_index_group", None) is not None or id(mob) not in depths:
+                return np.dot(mob.get_z_index_reference_point(), self.get_rotation_matrix().T)[2]
+            return depths[id(mob)]
+
+        try:
+            for group_type, group in it.groupby(sorted(mobjects, key=z_key), self.type_or_raise):
+                self.display_funcs[group_type](list(group), self.pixel_array)
+        finally:
+            self.projected = {}
+
     def transform_points_pre_display(self, mobject, points):
-        if getattr(mobject, "fixed", False):
+        cached = self.projected.get(id(mobject))
+        if cached is not None and cached[0] is points:
+            return cached[1]
+        if id(mobject) in self.fixed_ids:
             return points
         else:
             return super().transform_points_pre_display(mobject, points)
@@ -128,6 +191,7 @@ class MyThreeDScene(ThreeDScene):
 
 
 def make_fixed(*mobs):
+    MyCamera.fixed_tags += 1
     for mob in mobs:
         mob.fixed = True
         for submob in mob.family_members_with_points():
@@ -162,23 +226,13 @@ class ThreeFunc(MyThreeDScene):
         axes = ThreeDAxes()
 
         surface = VGroup(axes, s)
+        # prisms are built straight into the scaled-up surface's coordinates
+        centre = surface.get_center()
+        surface.scale(2)
 
-        # Group together axes and surface
         def create_prisms(n):
-            prisms = []
-            du = 4 / n
-            dv = 4 / n
-
-            for i in range(n):
-                for j in range(n):
-                    x = -2 + i * du
-                    y = -2 + j * dv
-                    z = func(x, y)[2]
-                    p = Prism(dimensions=[du, dv, z])
-                    p.set_color(MAROON)
-                    p.move_to([x, y, z / 2])
-                    prisms.append(p)
-            return VGroup(*prisms)
+            return PrismGrid(func, n, u_range=[-2, 2], v_range=[-2, 2], scale_factor=2,
+                             about_point=centre).set_color(MAROON)
 
         tex = MathTex("{{f(x,y)}} = {{ e^{-(x^2 + y^2)} }}", tex_template=self.stdtex).to_edge(UP, buff=0.4)
         tex[2].set_color(YELLOW)
@@ -196,8 +250,6 @@ class ThreeFunc(MyThreeDScene):
         box2 = SurroundingRectangle(texN, color=YELLOW, buff=SMALL_BUFF)
         make_fixed(tex, texN, box, box2)
         self.prisms = create_prisms(2)
-        total = VGroup(surface, self.prisms)
-        total.scale(2)
         self.add(surface)
         self.set_camera_orientation(frame_center=[0, 0, 1])
         self.add(box)
@@ -208,7 +260,7 @@ class ThreeFunc(MyThreeDScene):
         self.n_var[1].set_color(ORANGE)
         make_fixed(self.n_var)
         addRects = AnimationGroup(ApplyMethod(surface.set_opacity, 0.2), AnimationGroup(
-            LaggedStart(*[Write(p) for p in self.prisms], ReplacementTransform(box, box2), Write(self.n_var),
+            LaggedStart(Write(self.prisms), ReplacementTransform(box, box2), Write(self.n_var),
                         TransformMatchingTex(tex, texN))), lag_ratio=1, run_time=3)
         self.play(addRects)
         self.add_fixed_in_frame_mobjects(texN)
@@ -217,19 +269,16 @@ class ThreeFunc(MyThreeDScene):
         colors = [RED, BLUE, GREEN, YELLOW, ORANGE, PURPLE, PINK]
 
         def reRiemann(n):
-            total.remove(self.prisms)
-            total.scale(0.5)
             prismsnw = create_prisms(n)
-            total.add(prismsnw)
-            total.scale(2)
             n_var1 = MathTex("{{ n = m = }}", n).to_edge(DOWN, buff=0.4).to_edge(RIGHT)
             random_color = random.choice(colors)
             n_var1[1].set_color(random_color)
             make_fixed(n_var1)
             self.play(FadeTransform(self.prisms, prismsnw), TransformMatchingTex(self.n_var, n_var1))
+            self.prisms = prismsnw
             self.n_var = n_var1
 
-        # Update the prisms within the total VGroup
+        # Swap in finer prisms
         reRiemann(4)
         self.wait()
         reRiemann(8)
@@ -242,6 +291,8 @@ class ThreeFunc(MyThreeDScene):
 
 
 class VF(Scene):
+    particles = False  # VFFlow draws particles advected by the field on top
+
     def construct(self):
         tex_init(self)
         self.camera.background_color = COL
@@ -249,21 +300,30 @@ class VF(Scene):
 
         t = ValueTracker(0)
 
+        # pos is an (N, 3) array of points
         def func(pos, dt):
-            return np.sin(pos[1] + dt) * RIGHT + np.cos(pos[0] + dt) * UP
+            return np.sin(pos[..., 1] + dt)[..., None] * RIGHT + np.cos(pos[..., 0] + dt)[..., None] * UP
 
-        vector_field = always_redraw(
-            lambda: ArrowVectorField(lambda pos: func(pos, t.get_value())).scale(2)
-        )
+        vector_field = TimeVectorField(func, scale_factor=2)
+        vector_field.add_updater(lambda m: m.set_t(t.get_value()))
 
         mtx = MathTex(r"f: {{ \mathbb{R}^2 \to \mathbb{R}^2 }}").to_edge(UP, buff=0.4)
         mtx[1].set_color(ORANGE)
         box = SurroundingRectangle(mtx, color=WHITE, buff=SMALL_BUFF).set_fill(color=BLACK, opacity=1)
         self.play(Create(npl), Write(vector_field), Create(box), Write(mtx))
+        if self.particles:
+            flow = ParticleFlow(func, n=3000, t=t.get_value(), speed=0.5, scale_factor=2, background=COL)
+            flow.add_updater(lambda m, dt: m.step(dt, t.get_value()))
+            self.add(flow)
+            self.bring_to_front(box, mtx)
         self.play(t.animate.set_value(2 * PI), run_time=5, rate_func=rate_functions.ease_in_out_cubic)
         self.wait()
 
 
+class VFFlow(VF):
+    particles = True
+
+
 class PictureScene(Scene):
     def construct(self):
         def sub(self, other):
@@ -353,15 +413,14 @@ class VFScene(Scene):
 
         # Define the vector function
         def vector_func(t):
-            return np.array([scale_factor * np.cos(t), scale_factor * np.sin(t), 0])
+            return np.array([scale_factor * np.cos(t), scale_factor * np.sin(t), 0 * t])
 
         # Define the value tracker for time
         t_tracker = ValueTracker(0)
 
         # Define the vector and its position update function
-        vector = Vector(vector_func(t_tracker.get_value())).set_color(GREEN_A)
-        vector.add_updater(
-            lambda m: m.become(Vector(vector_func(t_tracker.get_value())).set_color(GREEN_B).shift((DOWN + LEFT))))
+        vector = MovingVector(vector_func(t_tracker.get_value())).set_color(GREEN_B)
+        vector.add_updater(lambda m: m.retarget(DOWN + LEFT, vector_func(t_tracker.get_value()) + DOWN + LEFT))
         txt = MathTex("t")
 
         # Define the slider
@@ -388,24 +447,12 @@ class VFScene(Scene):
             Tex("-1").next_to(npl.c2p(0, -1), LEFT, buff=0.17)
         ]
 
-        def color_map(value):
-            # Convert the input value to a value between 0 and 1
-            normalized_value = value / (2 * np.pi)
-
-            # Get the color from the hsv colormap, which is a rainbow colormap
-            color = plt.cm.hsv(normalized_value)
-
-            # Convert color to HEX form
-            hex_color = mcolors.rgb2hex(color[:3])
-
-            return hex_color
+        color_map = RAINBOW
 
         totparts = 800
-        lines = VGroup(*[Line(
-            vector_func((x - 1) * 2 * np.pi / totparts),
-            vector_func(x * 2 * np.pi / totparts)
-        ).set_color(color_map(x * 2 * np.pi / totparts)) for x in range(1, totparts + 1)])
-        lines.set_opacity(0)
+        ts = np.linspace(0, 2 * np.pi, totparts + 1)
+        # built where tg would shift it to, the unrevealed part is not in tg's family
+        lines = ColoredPolyline(vector_func(ts).T + DOWN + LEFT, color_map.rgba(ts[1:]), shown=0)
 
         def update_lines(m):
             # Calculate the corresponding points on the curve
@@ -413,15 +460,16 @@ class VFScene(Scene):
             v = k[0]
             if k[1] > 0.8:
                 v += 1
-            m[:v].set_opacity(1)
+            m.reveal(v)
 
         lines.add_updater(update_lines)
 
         #   bg = [BackgroundRectangle(x,fill_color=BLACK,fill_opacity=0.2,buff=0.1) for x in labels]
 
         # Add objects to the scene
-        tg = VGroup(npl, vector, lines, *labels)
+        tg = VGroup(npl, vector, *labels)
         tg.shift((DOWN + LEFT))
+        tg.insert(2, lines)
         mt = MathTex(r"\vec{r}(t) = \vecD{\cos(t)}{\sin(t)}", tex_template=self.stdtex).set_color(PINK).to_corner(
             UP + LEFT,
             buff=0.8).shift(
@@ -433,11 +481,6 @@ class VFScene(Scene):
         self.play(t_tracker.animate.set_value(2 * np.pi), run_time=8, rate_func=rate_functions.ease_in_out_cubic)
 
 
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-
-from manim import *
-
 
 class ShoelaceFormula(Scene):
     def construct(self):
@@ -488,24 +531,22 @@ class ParameterisedCurve1(Scene):
 
         # Define the vector function
         def vector_func(t):
-            return np.array([scale_factor * np.cos(t), scale_factor * np.sin(t), 0])
+            return np.array([scale_factor * np.cos(t), scale_factor * np.sin(t), 0 * t])
 
         def vector_func2(t):
-            return np.array([scale_factor * np.cos(2 * t), scale_factor * np.sin(2 * t), 0])
+            return np.array([scale_factor * np.cos(2 * t), scale_factor * np.sin(2 * t), 0 * t])
 
             # Define the value tracker for time
 
         t_tracker = ValueTracker(0)
         SHIFT = 3 * RIGHT
         # Define the vector and its position update function
-        vector = Vector(vector_func(t_tracker.get_value())).set_color(RED)
-        vector.add_updater(
-            lambda m: m.become(Vector(vector_func(t_tracker.get_value())).set_color(RED).shift(SHIFT)))
+        vector = MovingVector(vector_func(t_tracker.get_value())).set_color(RED)
+        vector.add_updater(lambda m: m.retarget(SHIFT, vector_func(t_tracker.get_value()) + SHIFT))
         txt = MathTex("t")
 
-        vector2 = Vector(vector_func2(t_tracker.get_value())).set_color(GREEN)
-        vector2.add_updater(
-            lambda m: m.become(Vector(vector_func2(t_tracker.get_value())).set_color(GREEN).shift(SHIFT)))
+        vector2 = MovingVector(vector_func2(t_tracker.get_value())).set_color(GREEN)
+        vector2.add_updater(lambda m: m.retarget(SHIFT, vector_func2(t_tracker.get_value()) + SHIFT))
 
         # Define the slider
         slider = NumberLine(x_range=[0, 2 * np.pi, np.pi], include_numbers=False)
@@ -531,15 +572,12 @@ class ParameterisedCurve1(Scene):
             Tex("-1").next_to(npl.c2p(0, -1), LEFT, buff=0.17)
         ]
 
-        curve = always_redraw(lambda:
-                              ParametricFunction(vector_func, t_range=[0, t_tracker.get_value()], color=RED).shift(
-                                  (SHIFT))
-                              )
+        # sampled once, the updaters only reveal more of it
+        curve = GrowingCurve(vector_func, t_range=[0, 2 * np.pi], use_vectorized=True, color=RED).shift(SHIFT)
+        curve.add_updater(lambda m: m.set_t(t_tracker.get_value()), call_updater=True)
 
-        curve2 = always_redraw(lambda:
-                               ParametricFunction(vector_func2, t_range=[0, t_tracker.get_value()], color=GREEN).shift(
-                                   (SHIFT))
-                               )
+        curve2 = GrowingCurve(vector_func2, t_range=[0, 2 * np.pi], use_vectorized=True, color=GREEN).shift(SHIFT)
+        curve2.add_updater(lambda m: m.set_t(t_tracker.get_value()), call_updater=True)
         tg = VGroup(npl, vector2, vector, *labels)
         tg.shift((SHIFT))
         mt = MathTex(r"\vec{r_1}(t) = \vecD{\cos(t)}{\sin(t)}", tex_template=self.stdtex).set_color(RED).to_corner(
@@ -621,8 +659,9 @@ class Slider:
         return self
 
 
-    def __init__(self, range=[0, 2 * np.pi, np.pi], length=5,
-                 labels={0: 0, np.pi: MathTex(r"\pi"), 2 * np.pi: MathTex(r"2\pi")}):
+    def __init__(self, range=[0, 2 * np.pi, np.pi], length=5, labels=None):
+        if labels is None:
+            labels = {0: 0, np.pi: MathTex(r"\pi"), 2 * np.pi: MathTex(r"2\pi")}
         self.txt = MathTex("t")
         self.lower = range[0]
         self.upper = range[1]
@@ -675,19 +714,9 @@ class TangentVectorParametric(Scene):
         parafunc = ParametricFunction(vector_func, t_range=[0, np.pi]).shift(SHIFT).set_color(RED)
         self.add(parafunc)
 
-        def color_map(value):
-            # Convert the input value to a value between 0 and 1
-            normalized_value = value / (2 * np.pi)
-
-            # Get the color from the hsv colormap, which is a rainbow colormap
-            color = plt.cm.hsv(normalized_value)
+        color_map = RAINBOW
 
-            # Convert color to HEX form
-            hex_color = mcolors.rgb2hex(color[:3])
-
-            return hex_color
-
-        vector = Vector([1.5, 1 - np.sin(0), 0]).set_color(WHITE)
+        vector = MovingVector([1.5, 1 - np.sin(0), 0]).set_color(WHITE)
 
         rprime = MathTex(r"\vec{r'}(t)").next_to(vector, direction=DOWN, buff=0.15)
         rprime.add_updater(lambda v: v.next_to(vector, direction=DOWN, buff=0.15).set_color(vector.get_color()))
@@ -695,10 +724,10 @@ class TangentVectorParametric(Scene):
         self.play(vector.animate.move_to(vector_func(0) + SHIFT).set_color(color_map(0.34)))
 
         def vectorUpdater(v):
-            dummy = Vector([1.5, 1 - np.sin(slider.t_tracker.get_value()), 0])
-            dummy.shift(vector_func(slider.t_tracker.get_value()) - (dummy.get_start() + dummy.get_end()) / 2)
-            dummy.shift(SHIFT).set_color(color_map(slider.t_tracker.get_value() + 0.34))
-            v.become(dummy)
+            t = slider.t_tracker.get_value()
+            half = np.array([1.5, 1 - np.sin(t), 0]) / 2
+            mid = vector_func(t) + SHIFT
+            v.retarget(mid - half, mid + half).set_color(color_map(t + 0.34))
 
         vector.add_updater(vectorUpdater)
 
@@ -754,17 +783,7 @@ class NormalVector1(MovingCameraScene):
 
         # Move the camera to the start of the path
 
-        def color_map(value):
-            # Convert the input value to a value between 0 and 1
-            normalized_value = value / (2 * np.pi)
-
-            # Get the color from the hsv colormap, which is a rainbow colormap
-            color = plt.cm.hsv(normalized_value)
-
-            # Convert color to HEX form
-            hex_color = mcolors.rgb2hex(color[:3])
-
-            return hex_color
+        color_map = RAINBOW
 
         vector = Vector(self.vector_funcd(c))
         dummy = Vector(vector.get_unit_vector())
@@ -780,7 +799,7 @@ class NormalVector1(MovingCameraScene):
         self.play(self.camera.frame.animate.scale(0.4).move_to(self.vector_func(c) + self.SHIFT))
 
         h = ValueTracker(0.5)
-        vector2 = Vector(self.vector_funcd(c + h.get_value()))
+        vector2 = MovingVector(self.vector_funcd(c + h.get_value()))
 
         dummy = Vector(vector2.get_unit_vector())
         dummy.shift(self.vector_func(c + h.get_value()) - (dummy.get_start() + dummy.get_end()) / 2)
@@ -789,10 +808,9 @@ class NormalVector1(MovingCameraScene):
 
         def vectorUpdater(v):
             dv = self.vector_funcd(c + h.get_value())
-            dummy = Vector(dv / np.linalg.norm(dv))
-            dummy.shift(self.vector_func(c + h.get_value()) - (dummy.get_start() + dummy.get_end()) / 2)
-            dummy.shift(self.SHIFT).set_color(color_map(1 + 3 * h.get_value()))
-            v.become(dummy).set_opacity(0.3)
+            half = dv / np.linalg.norm(dv) / 2
+            mid = self.vector_func(c + h.get_value()) + self.SHIFT
+            v.retarget(mid - half, mid + half).set_color(color_map(1 + 3 * h.get_value())).set_opacity(0.3)
 
         vector2.add_updater(vectorUpdater)
         rprime2 = MathTex(r"\vec{T}(t+{{h}})").scale(0.4).next_to(vector2.get_end(), direction=UP + RIGHT,
@@ -883,8 +901,6 @@ class NormalVector1(MovingCameraScene):
         self.play(h.animate.set_value(0.0001), run_time=5)
 
 
-from manim import *
-
 START_FRAME_WIDTH = config.frame_width
 START_FRAME_HEIGHT = config.frame_height
 ASPECT_RATIO = START_FRAME_WIDTH / START_FRAME_HEIGHT
@@ -927,7 +943,6 @@ class Testor(MovingCameraScene):
 
         mob.add_updater(updater)
 
-import re
 class ArcLengthFormula(Scene):
     scale_factor = 2
     SHIFT = 4.7 * LEFT + 0.65 * DOWN
@@ -945,25 +960,16 @@ class ArcLengthFormula(Scene):
     eq0 = None
     ntx = 0
     def texTransform(self,ind):
-        #MathTex(r"\sum_{i=1}^n", r"\sqrt{", r"\left(r_x(t_{i+1}) - r_x(t_i)\right)^2", "+",
-                  #    r"\left(r_y(t_{i+1}) - r_y(t_i)\right)^2}", "}")
-        ti = self.eqs[ind][1]
-        eq1 = self.eqs[ind][0]
-      #  eq1.align_to(self.eq0, UR)
-
-        def getTexTransform(transform_indices):
-                return [
-                    Create(eq1[j]) if i is None else
-                    ReplacementTransform(self.eq0[i], eq1[j]) if (type(i) is not str and j is not None) else
-                    FadeOut(self.eq0[int(re.search(r'\d+', str(i)).group())]) if (str(i)[-1] == "f" or j is None) else
-                    ReplacementTransform(self.eq0[int(i[:-1])].copy(), eq1[j], path_arc=90 * DEGREES)
-                    for i, j in zip(*transform_indices)
-                ]
-
-        v = getTexTransform(ti)
+        eq1, plan = self.eqs[ind]
+        v = plan.animations(self.eq0, eq1)
         self.eq0 = eq1
         return v
 
+    def add_eq(self, eq, transform_indices):
+        # parse and check the spec against the equation before it now, not when its play comes up
+        prev = self.eqs[-1][0] if self.eqs else self.eq0
+        self.eqs.append((eq, TexTransformPlan(transform_indices).check(prev, eq)))
+
 
 
     def vector_func(self, t):
@@ -974,6 +980,7 @@ class ArcLengthFormula(Scene):
         return NotImplementedError  # np.array([self.scale_factor * 1.5, self.scale_factor * (-2/(t*t + 1) + np.sin(t)), 0])
 
     def construct(self):
+        self.eqs = []
         parafunc = ParametricFunction(lambda t: self.vector_func(t), t_range=[0, np.pi]).shift(self.SHIFT).set_color(
             RED)
         self.add(parafunc)
@@ -981,23 +988,14 @@ class ArcLengthFormula(Scene):
             1.3).set_color(GREEN).next_to(parafunc, direction=UP)
         self.add(self.eq0)
 
-        def color_map(value):
-            # Convert the input value to a value between 0 and 1
-            normalized_value = value / (np.pi)
-
-            # Get the color from the hsv colormap, which is a rainbow colormap
-            color = plt.cm.hsv(normalized_value)
-
-            # Convert color to HEX form
-            hex_color = mcolors.rgb2hex(color[:3])
-
-            return hex_color
+        color_map = Colormap(period=np.pi)
 
         def create_lines(n):
-            lines = VGroup()
-            for t1, t2 in pairwise(np.linspace(0, np.pi, n, endpoint=True)):
-                lines.add(Line(self.vector_func(t1), self.vector_func(t2)).shift(self.SHIFT).set_color(
-                    color_map(t1))).set_stroke(width=5)
+            ts = np.linspace(0, np.pi, n, endpoint=True)
+            lines = VGroup(*[Line(self.vector_func(t1), self.vector_func(t2)).shift(self.SHIFT)
+                             for t1, t2 in pairwise(ts)])
+            color_map.paint(lines, ts[:-1])
+            lines.set_stroke(width=5)
 
             return lines
 
@@ -1007,14 +1005,14 @@ class ArcLengthFormula(Scene):
         self.play(Write(lns), Write(self.n_var))
         self.wait(2)
 
-        self.eqs.append((MathTex(
+        self.add_eq(MathTex(
             r"\sum_{i=1}^n", r"\sqrt{", r"\left(r_x(t_{i+1})", "-", r"r_x(t_i)\right)^2", "+", r"\left(r_y(t_{i+1})" ,"-", r"r_y(t_i)\right)^2","}").set_color(
             GREEN).next_to(parafunc, direction=UP),
             [[0,1,2,"2c","2c",3, 4, "4c","4c",5],
             #  | |      | |  |   |  |
             [0,1,2, 3,   4,  5, 6, 7,    8,  9],
 
-        ]))
+        ])
         self.eqs[self.ntx][0][1:9].set_color(ORANGE)
 
 
@@ -1049,7 +1047,7 @@ class ArcLengthFormula(Scene):
             r"\sum_{i=1}^n", r"\sqrt{", r"\left(r_x(t_i + \Delta t)", "-", r"r_x(t_i)\right)^2", "+", r"\left(r_y(t_i + \Delta t)", "-", r"r_y(t_i)\right)^2", "}").set_color(
             GREEN).next_to(parafunc, direction=UP)
         temp[1:9].set_color(ORANGE)
-        self.eqs.append((temp,[[x for x in range(10)],[x for x in range(10)]]))
+        self.add_eq(temp,[[x for x in range(10)],[x for x in range(10)]])
         self.ntx += 1
         lns = transform_lines(7,True)
 
@@ -1058,10 +1056,10 @@ class ArcLengthFormula(Scene):
             r"\sum_{i=1}^n", r"\sqrt{",r"\left(", r"\Delta t \cdot r'_x(t^*_i)", r"\right)","^2", "+", r"\left(", r"\Delta t \cdot r'_y(t^*_i)", r"\right)","^2","}").set_color(
             GREEN).next_to(parafunc, direction=UP)
         temp[1:-1].set_color(BLUE)
-        self.eqs.append((temp, [
+        self.add_eq(temp, [
             [0,1,2,None, None, None, "3f","4f",5,6, None, None, None, "7f","8f",9],
             [0,1,3,  2,    4, 5, None,None,6,8, 7, 9, 10, None,None,5]
-        ]))
+        ])
         self.ntx += 1
         lns = transform_lines(14,True)
 
@@ -1076,10 +1074,10 @@ class ArcLengthFormula(Scene):
             r"\left(", r"\Delta t", r"\right)", r"^2", r"\cdot", r"r'_y(t^*_i)", "^2", "}").set_color(
             GREEN).next_to(parafunc, direction=UP)
         temp[1:-1].set_color(BLUE)
-        self.eqs.append((temp, [
+        self.add_eq(temp, [
             [0, 1, 2, 3, 4, 5, None, None, "5c", 6, 7, 8, 9, 10, None, None, "10c", 11],
             [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
-        ]))
+        ])
         self.ntx += 1
         lns = transform_lines(20, True)
         self.play(ApplyMethod(self.eq0[3].set_color,RED),ApplyMethod(self.eq0[11].set_color,RED)) #3,11
@@ -1092,10 +1090,10 @@ class ArcLengthFormula(Scene):
             GREEN).next_to(parafunc, direction=UP)
         temp[1:-1].set_color(PURPLE)
         temp[-1].set_color(RED)
-        self.eqs.append((temp, [
+        self.add_eq(temp, [
             [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17],
             [0,1,None,8,None,None, None, 2, 3, 4, None, 8, None, None, None, 5, 6, 7]
-        ]))
+        ])
         self.ntx += 1
         lns = transform_lines(30,True)
         self.wait()
@@ -1106,10 +1104,10 @@ class ArcLengthFormula(Scene):
             GREEN).next_to(parafunc, direction=UP)
         temp[1:-1].set_color(PURPLE)
         temp[-1].set_color(RED)
-        self.eqs.append((temp, [
+        self.add_eq(temp, [
             [x for x in range(9)],
             [x for x in range(9)]
-        ]))
+        ])
         self.ntx += 1
         lns = transform_lines(100, True)
         self.wait()
@@ -1131,16 +1129,7 @@ class Example(Scene):
             #  | |      | |  |   |  |
             [0, 1, None, 2, 3, 4, 5, None],
         ]
-        def getTexTransform(transform_indices):
-                return [
-                    Create(eq1[j]) if i is None else
-                    ReplacementTransform(eq0[i], eq1[j]) if type(i) is not str and j is not None else
-                    FadeOut(eq0[int(i[:-1])]) if i[-1] == "f" or j is None else
-                    ReplacementTransform(eq0[int(i[:-1])].copy(), eq1[j], path_arc=90 * DEGREES)
-                    for i, j in zip(*transform_indices)
-                ]
-
-        self.play(*getTexTransform(transform_indexes))
+        self.play(*TexTransformPlan(transform_indexes).animations(eq0, eq1))
 
 class ArcLength56(Scene):
     scale_factor = 1
@@ -1222,14 +1211,12 @@ class Lp(Scene):
         # L2 Unit Ball (Circle)
       #  l2_ball = Circle(radius=2, color=RED, fill_opacity=0.4)
         t = ValueTracker(2)
-        l2_ball = always_redraw(
-            lambda: ImplicitFunction(lambda x, y: abs(x) ** t.get_value() + abs(y) ** t.get_value() - 1 if t.get_value() < 90 else
-            max(abs(x),abs(y)) - 1
-                                     , color=RED)
-            .scale(2)
+        l2_ball = (
+            LpBall(t.get_value(), radius=2, color=RED)
             .set_fill(RED, opacity=0.4)
             .set_stroke(width=3)  # You can adjust the stroke width to your liking
         )
+        l2_ball.add_updater(lambda m: m.set_p(t.get_value()))
 
        # def makeText():
         #    v = int(t.get_value()) if int(t.get_value()) == t.get_value() else round(t.get_value(),2)
@@ -1261,18 +1248,12 @@ class Lp(Scene):
         self.add(adj)
         self.play(t.animate.set_value(1),TransformMatchingTex(txt,txt1),run_time=1)
 
-        def genPoint(x):
-           # print(1-abs(x))
-            if t.get_value() > 90:
-                if x > -1:
-                    return 2
-                return (2-abs(x+1))
-            return 2*(1-(abs(x))**t.get_value())**(1/t.get_value())
+        path = LpBoundaryPath(radius=2)
         t1 = ValueTracker(1) # -1 0 1 top hemi
         t2 = ValueTracker(0)
 
-        dot1 = Dot([2,0,0]).set_color(BLUE).add_updater(lambda d: d.move_to([-2 if t1.get_value() < -1 else (2*t1.get_value() if t1.get_value() <= 1 else 2*(2-t1.get_value())),genPoint(t1.get_value()) if t1.get_value() <= 1 else -genPoint(2 - t1.get_value()),0]))
-        dot2 = Dot([0,2,0]).set_color(TEAL).add_updater(lambda d: d.move_to([-2 if t2.get_value() < -1 else (2*t2.get_value() if t2.get_value() <= 1 else 2*(2-t2.get_value())),genPoint(t2.get_value()) if t2.get_value() <= 1 else -genPoint(2 - t2.get_value()),0]))
+        dot1 = Dot([2,0,0]).set_color(BLUE).add_updater(lambda d: d.move_to(path.point(t1.get_value(), t.get_value())))
+        dot2 = Dot([0,2,0]).set_color(TEAL).add_updater(lambda d: d.move_to(path.point(t2.get_value(), t.get_value())))
         lne = always_redraw(lambda:
                             Line(dot1.get_center(),dot2.get_center()).set_color(YELLOW)
                             )
@@ -1325,18 +1306,12 @@ class LpLI(Scene):
         adj.shift(SHIFT)
         self.add(adj)
 
-        def genPoint(x):
-           # print(1-abs(x))
-            if t.get_value() > 90:
-                if x > -1:
-                    return 2
-                return (2-abs(x+1))
-            return 2*(1-(abs(x))**t.get_value())**(1/t.get_value())
+        path = LpBoundaryPath(radius=2, center=SHIFT)
         t1 = ValueTracker(1.7) # -1 0 1 top hemi
         t2 = ValueTracker(0.7)
 
-        dot1 = Dot(SHIFT+[-2 if t1.get_value() < -1 else (2*t1.get_value() if t1.get_value() <= 1 else 2*(2-t1.get_value())),genPoint(t1.get_value()) if t1.get_value() <= 1 else -genPoint(2 - t1.get_value()),0]).set_color(BLUE).add_updater(lambda d: d.move_to(SHIFT+[-2 if t1.get_value() < -1 else (2*t1.get_value() if t1.get_value() <= 1 else 2*(2-t1.get_value())),genPoint(t1.get_value()) if t1.get_value() <= 1 else -genPoint(2 - t1.get_value()),0]))
-        dot2 = Dot(SHIFT+[-2 if t2.get_value() < -1 else (2*t2.get_value() if t2.get_value() <= 1 else 2*(2-t2.get_value())),genPoint(t2.get_value()) if t2.get_value() <= 1 else -genPoint(2 - t2.get_value()),0]).set_color(TEAL).add_updater(lambda d: d.move_to(SHIFT+[-2 if t2.get_value() < -1 else (2*t2.get_value() if t2.get_value() <= 1 else 2*(2-t2.get_value())),genPoint(t2.get_value()) if t2.get_value() <= 1 else -genPoint(2 - t2.get_value()),0]))
+        dot1 = Dot(path.point(t1.get_value(), t.get_value())).set_color(BLUE).add_updater(lambda d: d.move_to(path.point(t1.get_value(), t.get_value())))
+        dot2 = Dot(path.point(t2.get_value(), t.get_value())).set_color(TEAL).add_updater(lambda d: d.move_to(path.point(t2.get_value(), t.get_value())))
         lne = always_redraw(lambda:
                             Line(dot1.get_center(),dot2.get_center()).set_color(YELLOW)
                             )
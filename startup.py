@@ -0,0 +1,81 @@
+"""Check that importing scene.py stays cheap.
+
+    python startup.py          # best of 5 fresh interpreters, exit 1 if over budget
+    python startup.py -n 10 -v # more runs, and the slowest modules we add on top of manim
+
+Every render worker, render.py --list and dryrun.py import scene.py before
+doing anything else. Manim (with numpy and scipy) is the floor. Everything
+else scene.py brings in is measured with ``python -X importtime`` as the
+cumulative time of ``import scene`` minus that of ``import manim`` in its own
+interpreter, and has to stay under BUDGET_MS. Modules in LAZY must not be
+imported at all: the helpers import them when a scene that needs them is built.
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+from render import ROOT
+
+# a chosen ceiling, not a measurement: nothing here has timed scene.py on top of
+# a real manim yet, tighten it from what `python startup.py -n 10` reports
+BUDGET_MS = 50
+
+# loaded on first use by colormap.Colormap.lut and mobjects.ImplicitContour
+LAZY = ("matplotlib", "contourpy")
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_times(module="scene"):
+    "[(depth, name, self us, cumulative us)] for one fresh `import module`, in completion order."
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode:
+        # stderr is the import profile followed by the traceback, its last line says what broke
+        raise RuntimeError(f"import {module} failed: {proc.stderr.strip().splitlines()[-1]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            rows.append((len(indent) // 2, name, int(own), int(cumulative)))
+    return rows
+
+
+def measure(module="scene", floor_module="manim"):
+    "Cumulative ms of module, of floor_module on its own, and the modules only module brings in."
+    rows = import_times(module)
+    floor_rows = import_times(floor_module)
+    total = next(cum for depth, name, _, cum in rows if depth == 0 and name == module)
+    floor = next(cum for depth, name, _, cum in floor_rows if depth == 0 and name == floor_module)
+    # numpy comes first in scene.py but manim needs it anyway, so compare sets rather than subtrees
+    shared = {name for _, name, _, _ in floor_rows}
+    extra = [(name, own) for _, name, own, _ in rows if name not in shared]
+    return total / 1e3, floor / 1e3, [name for name, _ in extra], sorted(extra, key=lambda row: -row[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        runs = [measure() for _ in range(args.runs)]
+    except RuntimeError as e:
+        parser.exit(2, f"{e}\n")
+    total, floor, loaded, slowest = min(runs, key=lambda run: run[0] - run[1])
+    overhead = total - floor
+    print(f"import scene {total:6.0f} ms, manim {floor:6.0f} ms, ours {overhead:5.0f} ms (budget {BUDGET_MS} ms)")
+    if args.verbose:
+        for name, own in slowest[:15]:
+            print(f"  {own / 1e3:7.1f} ms  {name}")
+    eager = sorted({name for name in loaded if name.split(".")[0] in LAZY})
+    if eager:
+        print(f"imported eagerly, should be lazy: {', '.join(eager)}")
+    sys.exit(overhead > BUDGET_MS or bool(eager))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the helpers are flat modules next to scene.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Dot, Scene
+
+from render import render_one
+
+
+class NoPlays(Scene):
+    # like LongD: adds mobjects, never plays or waits, and has no OUTPUTS entry
+    def construct(self):
+        self.add(Dot())
+
+
+def test_zero_play_scene_renders_a_still(tmp_path):
+    overrides = {"media_dir": str(tmp_path), "tex_dir": str(tmp_path / "Tex")}
+    name, _, output = render_one("NoPlays", "l", module_name=__name__, publish=False, overrides=overrides)
+    assert name == "NoPlays"
+    assert output.suffix == ".png"
+    assert output.exists()
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Circle, Create, FadeOut, Scene, tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+
+import segments
+
+
+class Seeded(Scene):
+    def construct(self):
+        # state on self and a random pick, the two things segments.py makes hashable
+        self.radius = 0.5 + random.random()
+        circle = Circle(radius=self.radius)
+        self.play(Create(circle), run_time=0.2)
+        self.play(FadeOut(circle), run_time=0.2)
+
+
+def test_second_render_hits_cache(tmp_path, monkeypatch):
+    segments.install()
+    cached = []
+    is_already_cached = SceneFileWriter.is_already_cached
+
+    def record(self, hash_invocation):
+        hit = is_already_cached(self, hash_invocation)
+        cached.append(hit)
+        return hit
+
+    monkeypatch.setattr(SceneFileWriter, "is_already_cached", record)
+    with tempconfig({"media_dir": str(tmp_path), "quality": "low_quality", "disable_caching": False,
+                     "progress_bar": "none", "verbosity": "WARNING"}):
+        Seeded().render()
+        first = list(cached)
+        cached.clear()
+        Seeded().render()
+    assert first == [False, False]
+    assert cached == [True, True]
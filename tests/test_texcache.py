@@ -0,0 +1,73 @@
+import shutil
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+pytestmark = pytest.mark.skipif(not (shutil.which("latex") and shutil.which("dvisvgm")),
+                                reason="needs latex and dvisvgm")
+
+from manim import MathTex, Scene, SVGMobject, Tex, TexTemplate, config, tempconfig
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+
+import texcache
+from texcache import TexCache
+
+# what Tex and an aligned MathTex hand to tex_to_svg_file
+REQUESTS = [
+    ("center", r"Batched $\int_0^1 x^2 \, dx$ text"),
+    ("align*", r"a^2 + b^2 &= c^2 \\ e^{i\pi} &= -1"),
+]
+
+
+def points(svg_file):
+    # unscaled like Tex/MathTex, so a different page size would show
+    svg = SVGMobject(str(svg_file), height=None)
+    return np.concatenate([mob.points for mob in svg.family_members_with_points()])
+
+
+@pytest.mark.parametrize("use_format", [False, True], ids=["plain", "format"])
+def test_batch_matches_single(tmp_path, use_format):
+    template = TexTemplate()
+    batched = TexCache(tmp_path / "batched", use_format=False)
+    # with use_format the single compiles load the dumped preamble format
+    single = TexCache(tmp_path / "single", use_format=use_format)
+    with tempconfig({"tex_dir": str(tmp_path / "Tex-batched")}):
+        batched.compile_batch(REQUESTS, template)
+    with tempconfig({"tex_dir": str(tmp_path / "Tex-single")}):
+        singles = [single.tex_to_svg_file(expression, environment, template) for environment, expression in REQUESTS]
+    for (environment, expression), single_file in zip(REQUESTS, singles):
+        batch_file = batched.path(expression, environment, template)
+        assert batch_file.exists(), f"batch left {environment} uncached"
+        np.testing.assert_allclose(points(batch_file), points(single_file), atol=1e-6)
+
+
+class ThreeFormulas(Scene):
+    def construct(self):
+        self.add(MathTex(r"a^2 + b^2"), MathTex(r"\sum_{i=1}^n i"), Tex(r"three $x$"))
+
+
+def test_edited_preamble_batches_on_next_render(tmp_path, monkeypatch):
+    for owner, attr in [(tex_mobject, "tex_to_svg_file"), (Scene, "render"), (texcache, "installed")]:
+        monkeypatch.setattr(owner, attr, getattr(owner, attr))
+    cache = texcache.install(TexCache(tmp_path / "cache", use_format=False, requests_dir=tmp_path / "requests"))
+    compiles = []
+    compile_tex = tex_file_writing.compile_tex
+
+    def counted(*args, **kwargs):
+        compiles.append(args[0])
+        return compile_tex(*args, **kwargs)
+
+    monkeypatch.setattr(tex_file_writing, "compile_tex", counted)
+    with tempconfig({"media_dir": str(tmp_path / "media"), "tex_dir": str(tmp_path / "Tex"), "format": "png",
+                     "progress_bar": "none", "verbosity": "WARNING"}):
+        config.tex_template = TexTemplate()
+        ThreeFormulas().render()
+        assert len(compiles) == 3
+        config.tex_template.add_to_preamble(r"\usepackage{amssymb}")
+        compiles.clear()
+        misses = cache.misses
+        ThreeFormulas().render()
+    assert len(compiles) == 1
+    assert cache.misses == misses
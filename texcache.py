@@ -0,0 +1,285 @@
+"""Persistent LaTeX -> SVG cache shared by every scene in scene.py.
+
+Manim already keeps compiled SVGs in media/Tex, but that directory is per
+checkout and keyed on the whole .tex file. Entries here live under
+``TEXCACHE_DIR/<preamble hash>/<expression hash>.svg`` so re-runs, other
+checkouts and other render workers skip latex and dvisvgm entirely.
+
+Misses are compiled against a TeX format dumped from the template preamble
+(via mylatexformat), so the tikz/pgf setup in ``textemp`` is parsed once per
+preamble instead of once per formula. Set ``TEXCACHE_FMT=0`` to turn that off.
+
+Every scene render also records the TeX strings it asked for, and whether
+against the config template or manim's default one (``TEXCACHE_REQUESTS``).
+On the next render of that scene the strings not cached under today's
+version of their template, all of them after an edit to ``textemp``, are
+compiled up front in one multi-page document and split back into
+per-formula SVGs, so a scene with a dozen MathTex pays for one latex process
+instead of dozens.
+"""
+import atexit
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import Scene, TexTemplate, config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+
+CACHE_DIR = Path(os.environ.get("TEXCACHE_DIR", Path.home() / ".cache" / "texcache"))
+# what each scene asked for last time, kept apart from the SVGs so emptying
+# the cache (bench.py --cold-tex) still leaves something to batch
+REQUESTS_DIR = Path(os.environ.get("TEXCACHE_REQUESTS", Path.home() / ".cache" / "texcache" / "scenes"))
+USE_FORMAT = os.environ.get("TEXCACHE_FMT", "1") != "0"
+
+# compilers that can dump and load a format built on top of LaTeX
+FORMAT_COMPILERS = {"latex", "pdflatex"}
+
+# every formula of a batch document goes in one of these, standalone's multi
+# mode turns each into its own page
+BATCH_ENV = "texcachepage"
+
+# templates a request is recorded against, by role rather than by content:
+# replayed with today's template an edited preamble batches everything again
+ROLES = {"config": lambda: config.tex_template, "default": TexTemplate}
+
+
+def _digest(*parts):
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(str(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:16]
+
+
+def preamble_hash(tex_template):
+    "Hash of everything in a template except the expression itself."
+    return _digest(tex_template.tex_compiler, tex_template.output_format, tex_template.body)
+
+
+def template_role(tex_template):
+    "The ROLES entry tex_template currently is, None for a template of the scene's own."
+    key = preamble_hash(tex_template)
+    for role, current in ROLES.items():
+        if preamble_hash(current()) == key:
+            return role
+    return None
+
+
+class TexCache:
+    def __init__(self, directory=CACHE_DIR, use_format=USE_FORMAT, requests_dir=REQUESTS_DIR):
+        self.directory = Path(directory)
+        self.use_format = use_format
+        self.requests_dir = Path(requests_dir)
+        self.formats = {}
+        self.requested = None
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, expression, environment, tex_template):
+        return self.directory / preamble_hash(tex_template) / (_digest(environment, expression) + ".svg")
+
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        # same signature as manim.utils.tex_file_writing.tex_to_svg_file
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        if self.requested is not None:
+            role = template_role(tex_template)
+            if role is not None:
+                self.requested.append([role, environment, expression])
+        cached = self.path(expression, environment, tex_template)
+        if cached.exists():
+            self.hits += 1
+            return cached
+        self.misses += 1
+        self.store(cached, self.compile(expression, environment, tex_template))
+        return cached
+
+    def compile(self, expression, environment, tex_template):
+        fmt = self.format_file(tex_template)
+        if fmt is None:
+            return tex_file_writing.tex_to_svg_file(expression, environment, tex_template)
+        tex_file = tex_file_writing.generate_tex_file(expression, environment, tex_template)
+        svg_file = tex_file.with_suffix(".svg")
+        if not svg_file.exists():
+            dvi_file = self.compile_with_format(tex_file, tex_template, fmt)
+            svg_file = tex_file_writing.convert_to_svg(dvi_file, tex_template.output_format)
+            if not config["no_latex_cleanup"]:
+                tex_file_writing.delete_nonsvg_files()
+        return svg_file
+
+    def format_file(self, tex_template):
+        "Path of the .fmt holding this template's preamble, dumping it on first use."
+        if not self.use_format or tex_template.tex_compiler not in FORMAT_COMPILERS:
+            return None
+        key = preamble_hash(tex_template)
+        if key in self.formats:
+            return self.formats[key]
+        fmt = self.directory / key / "preamble.fmt"
+        if not fmt.exists():
+            fmt.parent.mkdir(parents=True, exist_ok=True)
+            # dump under a private job name, other workers may be doing the same
+            job = f"preamble-{os.getpid()}"
+            src = fmt.with_name(job + ".tex")
+            src.write_text(tex_template.get_texcode_for_expression(""), encoding="utf-8")
+            compiler = tex_template.tex_compiler
+            subprocess.run(
+                [compiler, "-ini", "-interaction=batchmode", "-halt-on-error", f"-jobname={job}",
+                 f"&{compiler}", "mylatexformat.ltx", src.name],
+                cwd=fmt.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            for leftover in (src, fmt.with_name(job + ".log")):
+                leftover.unlink(missing_ok=True)
+            dumped = fmt.with_name(job + ".fmt")
+            if dumped.exists():
+                os.replace(dumped, fmt)
+            else:
+                logger.warning("Could not dump a TeX format for preamble %s, compiling without it", key)
+                fmt = None
+        self.formats[key] = fmt
+        return fmt
+
+    def compile_with_format(self, tex_file, tex_template, fmt):
+        result = tex_file.with_suffix(tex_template.output_format)
+        if result.exists():
+            return result
+        tex_dir = config.get_dir("tex_dir")
+        # run next to the .fmt so kpathsea finds it by name
+        exit_code = subprocess.run(
+            [tex_template.tex_compiler, f"-fmt={fmt.stem}", "-interaction=batchmode", "-halt-on-error",
+             f"-output-format={tex_template.output_format[1:]}",
+             f"-output-directory={Path(tex_dir).resolve()}", str(tex_file.resolve())],
+            cwd=fmt.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        ).returncode
+        if exit_code != 0:
+            # let manim retry from scratch and report the error the usual way
+            return tex_file_writing.compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+        return result
+
+    def manifest(self, scene_name):
+        return self.requests_dir / f"{scene_name}.json"
+
+    def save_requests(self, scene_name):
+        path = self.manifest(scene_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.requested, indent=1), encoding="utf-8")
+
+    def prefetch(self, scene_name):
+        "Batch-compile whatever the last render of scene_name asked for and is not cached."
+        path = self.manifest(scene_name)
+        if not path.exists():
+            return
+        templates = {role: current() for role, current in ROLES.items()}
+        pending = {}
+        for role, environment, expression in json.loads(path.read_text(encoding="utf-8")):
+            tex_template = templates.get(role)
+            if tex_template is None or self.path(expression, environment, tex_template).exists():
+                continue
+            pending.setdefault(role, {})[(environment, expression)] = None
+        for role, requests in pending.items():
+            if len(requests) > 1:
+                self.compile_batch(list(requests), templates[role])
+
+    def compile_batch(self, requests, tex_template):
+        """Compile (environment, expression) pairs in one latex run and cache each page.
+
+        Any failure just leaves the entries uncached, they are then compiled
+        one by one as the scene asks for them.
+        """
+        match = re.fullmatch(r"\\documentclass(?:\[(.*)\])?\{standalone\}", tex_template.documentclass.strip())
+        if getattr(tex_template, "_body", "") or match is None:
+            return
+        batch = tex_template.copy()
+        options = [o for o in (match.group(1) or "").split(",") if o.strip()]
+        batch.documentclass = r"\documentclass[%s]{standalone}" % ",".join(options + [f"multi={BATCH_ENV}"])
+        batch.add_to_preamble(r"\newenvironment{%s}{}{}" % BATCH_ENV)
+
+        head, tail = tex_template.body.split(tex_template.placeholder_text, 1)
+        pages = []
+        for environment, expression in requests:
+            if environment is None:
+                code = tex_template.get_texcode_for_expression(expression)
+            else:
+                code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+            pages.append("\\begin{%s}\n%s\n\\end{%s}" % (BATCH_ENV, code[len(head):len(code) - len(tail)], BATCH_ENV))
+        output = batch.get_texcode_for_expression("\n".join(pages))
+
+        tex_dir = Path(config.get_dir("tex_dir"))
+        tex_dir.mkdir(parents=True, exist_ok=True)
+        tex_file = tex_dir / f"batch-{_digest(output)}.tex"
+        tex_file.write_text(output, encoding="utf-8")
+        try:
+            dvi_file = tex_file_writing.compile_tex(tex_file, batch.tex_compiler, batch.output_format)
+        except ValueError:
+            logger.warning("Batch TeX compile of %d formulas failed, compiling them one by one", len(requests))
+            return
+        subprocess.run(
+            ["dvisvgm", *(["--pdf"] if batch.output_format == ".pdf" else []), "-p", "1-", "-n", "-v", "0",
+             "-o", f"{tex_file.stem}-%p.svg", dvi_file.name],
+            cwd=tex_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        svgs = sorted(tex_dir.glob(f"{tex_file.stem}-*.svg"), key=lambda f: int(f.stem.rsplit("-", 1)[1]))
+        if len(svgs) != len(requests):
+            logger.warning("Batch TeX compile gave %d pages for %d formulas, ignoring it", len(svgs), len(requests))
+        else:
+            for (environment, expression), svg_file in zip(requests, svgs):
+                self.store(self.path(expression, environment, tex_template), svg_file)
+        for svg_file in svgs:
+            svg_file.unlink()
+        if not config["no_latex_cleanup"]:
+            tex_file_writing.delete_nonsvg_files()
+
+    def store(self, cached, svg_file):
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        # copy then rename so a parallel render never reads half a file
+        fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(svg_file, tmp)
+        os.replace(tmp, cached)
+
+    def __str__(self):
+        return f"tex cache {self.directory}: {self.hits} hits, {self.misses} misses"
+
+
+cache = TexCache()
+
+# the cache install() routed compiles to last, the Scene.render wrapper and report() look it up here
+installed = None
+
+
+def install(tex_cache=cache):
+    "Route every Tex/MathTex compile through tex_cache."
+    global installed
+    installed = tex_cache
+    tex_mobject.tex_to_svg_file = tex_cache.tex_to_svg_file
+
+    if not getattr(Scene.render, "texcache", False):
+        render = Scene.render
+
+        @functools.wraps(render)
+        def render_with_prefetch(scene, *args, **kwargs):
+            current = installed
+            name = type(scene).__name__
+            current.prefetch(name)
+            current.requested = []
+            try:
+                return render(scene, *args, **kwargs)
+            finally:
+                current.save_requests(name)
+                current.requested = None
+
+        render_with_prefetch.texcache = True
+        Scene.render = render_with_prefetch
+    return tex_cache
+
+
+@atexit.register
+def report():
+    if installed is not None and (installed.hits or installed.misses):
+        logger.info(str(installed))
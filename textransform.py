@@ -0,0 +1,82 @@
+"""Part-by-part MathTex -> MathTex morphs from a hand-written index spec.
+
+A spec is two parallel lists, parts of the current equation eq0 and parts
+of the next one eq1::
+
+    [[0, 1, "2f", 3, "1c", None],
+     [0, 1, None, 2, 4,    5]]
+
+* ``i, j``             ReplacementTransform(eq0[i], eq1[j])
+* ``"ic", j``          a copy of eq0[i] arcs over into eq1[j], eq0[i] stays
+* ``"if", _``/``i, None``  FadeOut(eq0[i])
+* ``None, j``          Create(eq1[j])
+
+TexTransformPlan parses a spec once and checks it against the number of
+parts of both equations before building anything, so a wrong index fails
+when the plan is made rather than partway through a render.
+"""
+import re
+
+from manim import DEGREES, Create, FadeOut, ReplacementTransform, logger
+
+SOURCE = re.compile(r"(\d+)([cf]?)")
+
+
+class TexTransformPlan:
+    def __init__(self, spec):
+        sources, targets = spec
+        if len(sources) != len(targets):
+            raise ValueError(f"spec rows differ in length: {len(sources)} sources, {len(targets)} targets")
+        self.steps = [self.parse(i, j) for i, j in zip(sources, targets)]
+        self.checked = None
+
+    @staticmethod
+    def parse(i, j):
+        "One (source, target) pair -> (kind, i, j) with kind create/fade/copy/move."
+        if i is None:
+            if j is None:
+                raise ValueError("None -> None does nothing")
+            return "create", None, j
+        kind = ""
+        if isinstance(i, str):
+            match = SOURCE.fullmatch(i)
+            if match is None:
+                raise ValueError(f"bad source {i!r}, expected an index, 'Nc' or 'Nf'")
+            i, kind = int(match.group(1)), match.group(2)
+        if kind == "f" or j is None:
+            return "fade", i, None
+        return ("copy" if kind == "c" else "move"), i, j
+
+    def check(self, eq0, eq1):
+        "Raise if an index is out of range for eq0/eq1, warn about visible parts of eq1 nothing lands on."
+        shape = (len(eq0), len(eq1))
+        if shape == self.checked:
+            return self
+        errors = []
+        for kind, i, j in self.steps:
+            if i is not None and not 0 <= i < shape[0]:
+                errors.append(f"source {i} ({kind}) but eq0 has {shape[0]} parts")
+            if j is not None and not 0 <= j < shape[1]:
+                errors.append(f"target {j} ({kind}) but eq1 has {shape[1]} parts")
+        if errors:
+            raise ValueError("bad tex transform spec: " + "; ".join(errors))
+        reached = {j for _, _, j in self.steps}
+        missing = [j for j in range(shape[1]) if j not in reached and eq1[j].family_members_with_points()]
+        if missing:
+            logger.warning("tex transform never shows parts %s of %s", missing, eq1.tex_string)
+        self.checked = shape
+        return self
+
+    def animations(self, eq0, eq1):
+        self.check(eq0, eq1)
+        animations = []
+        for kind, i, j in self.steps:
+            if kind == "create":
+                animations.append(Create(eq1[j]))
+            elif kind == "fade":
+                animations.append(FadeOut(eq0[i]))
+            elif kind == "copy":
+                animations.append(ReplacementTransform(eq0[i].copy(), eq1[j], path_arc=90 * DEGREES))
+            else:
+                animations.append(ReplacementTransform(eq0[i], eq1[j]))
+        return animations
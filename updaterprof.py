@@ -0,0 +1,170 @@
+"""Time every updater call of a scene, frame by frame.
+
+    python updaterprof.py NormalVector1                 # real render, table sorted by total time
+    python updaterprof.py NormalVector1 --dry-run       # same, without drawing (see dryrun.py)
+    python updaterprof.py VF --sort max --trace vf.json # worst single call first, plus a Chrome trace
+    python updaterprof.py Lp --alloc                    # also trace allocations (much slower)
+
+While installed, Mobject.update runs each updater itself and records its wall
+time and the net number of memory blocks it left allocated
+(sys.getallocatedblocks), Scene.update_mobjects marks the frame boundaries.
+Updaters are named after the function and the line that defines them, so the
+lambdas in Slider.__init__ or NormalVector1 come out as
+``NormalVector1.construct.<lambda>:855`` next to the mobject type they update.
+
+--trace writes the Chrome trace event format (chrome://tracing, Perfetto):
+one slice per frame with the updater calls nested inside it. --alloc turns on
+tracemalloc and adds the peak bytes each call allocated.
+"""
+import argparse
+import inspect
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from manim import Mobject, Scene
+
+from render import QUALITIES, discover, render_one
+
+SORT_KEYS = ("total", "mean", "max", "calls", "blocks", "peak")
+
+
+def updater_label(updater):
+    "Where an updater was defined, short enough to read in a table."
+    func = getattr(updater, "func", updater)  # functools.partial
+    code = getattr(func, "__code__", None)
+    name = getattr(func, "__qualname__", type(func).__name__).replace("<locals>.", "")
+    return f"{name}:{code.co_firstlineno}" if code else name
+
+
+class UpdaterProfiler:
+    "Patches Mobject.update and Scene.update_mobjects while entered, records one event per updater call."
+
+    def __init__(self, alloc=False):
+        self.alloc = alloc
+        self.calls = []   # (frame, label, mobject type, start, seconds, blocks, peak bytes)
+        self.frames = []  # (start, seconds)
+        self.labels = {}
+
+    def __enter__(self):
+        self.saved = Mobject.update, Scene.update_mobjects
+        self.origin = time.perf_counter()
+        if self.alloc:
+            tracemalloc.start()
+        profiler = self
+
+        def update(mob, dt=0, recursive=True):
+            if mob.updating_suspended:
+                return mob
+            for updater in mob.updaters:
+                args = (mob, dt) if "dt" in inspect.signature(updater).parameters else (mob,)
+                profiler.call(mob, updater, args)
+            if recursive:
+                for submob in mob.submobjects:
+                    submob.update(dt, recursive)
+            return mob
+
+        def update_mobjects(scene, dt):
+            start = time.perf_counter()
+            profiler.saved[1](scene, dt)
+            profiler.frames.append((start - profiler.origin, time.perf_counter() - start))
+
+        Mobject.update, Scene.update_mobjects = update, update_mobjects
+        return self
+
+    def __exit__(self, *exc):
+        Mobject.update, Scene.update_mobjects = self.saved
+        if self.alloc:
+            tracemalloc.stop()
+
+    def call(self, mob, updater, args):
+        label = self.labels.get(updater)
+        if label is None:
+            label = self.labels[updater] = updater_label(updater)
+        peak = 0
+        if self.alloc:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        updater(*args)
+        seconds = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - blocks
+        if self.alloc:
+            peak = tracemalloc.get_traced_memory()[1] - base
+        self.calls.append((len(self.frames), label, type(mob).__name__, start - self.origin, seconds, blocks, peak))
+
+    def summary(self, sort="total"):
+        "One row per updater (label, mobject type), sorted descending by `sort`."
+        rows = defaultdict(lambda: {"calls": 0, "total": 0.0, "max": 0.0, "blocks": 0, "peak": 0})
+        for _, label, kind, _, seconds, blocks, peak in self.calls:
+            row = rows[label, kind]
+            row["calls"] += 1
+            row["total"] += seconds
+            row["max"] = max(row["max"], seconds)
+            row["blocks"] += blocks
+            row["peak"] = max(row["peak"], peak)
+        table = [{"updater": label, "mobject": kind, **row, "mean": row["total"] / row["calls"]}
+                 for (label, kind), row in rows.items()]
+        table.sort(key=lambda row: row[sort], reverse=True)
+        return table
+
+    def chrome_trace(self):
+        events = [{"name": f"frame {i}", "cat": "frame", "ph": "X", "pid": 0, "tid": 0,
+                   "ts": start * 1e6, "dur": seconds * 1e6}
+                  for i, (start, seconds) in enumerate(self.frames)]
+        events += [{"name": label, "cat": kind, "ph": "X", "pid": 0, "tid": 0, "ts": start * 1e6,
+                    "dur": seconds * 1e6, "args": {"frame": frame, "blocks": blocks, "peak_bytes": peak}}
+                   for frame, label, kind, start, seconds, blocks, peak in self.calls]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def print_summary(profiler, sort="total", limit=None):
+    table = profiler.summary(sort)
+    frame_total = sum(seconds for _, seconds in profiler.frames)
+    print(f"{'updater':<48} {'mobject':<16} {'calls':>6} {'total ms':>9} {'mean ms':>8} {'max ms':>8} "
+          f"{'blocks':>8} {'peak KB':>8}")
+    for row in table[:limit]:
+        print(f"{row['updater'][:48]:<48} {row['mobject'][:16]:<16} {row['calls']:>6} {row['total'] * 1e3:9.1f} "
+              f"{row['mean'] * 1e3:8.3f} {row['max'] * 1e3:8.3f} {row['blocks']:>8} {row['peak'] / 1024:8.1f}")
+    print(f"{len(profiler.frames)} frames, {frame_total:.2f}s in Scene.update_mobjects, "
+          f"{sum(row['total'] for row in table):.2f}s of it in updaters")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("--dry-run", action="store_true", help="run the scene headless instead of rendering it")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="total")
+    parser.add_argument("--limit", type=int, default=None, help="only print the first N rows")
+    parser.add_argument("--alloc", action="store_true", help="record peak bytes per call with tracemalloc")
+    parser.add_argument("--trace", help="write a Chrome trace JSON here")
+    parser.add_argument("--json", help="write the sorted table here")
+    args = parser.parse_args()
+
+    if args.scene not in discover():
+        parser.error(f"unknown scene: {args.scene}")
+    with UpdaterProfiler(alloc=args.alloc) as profiler:
+        if args.dry_run:
+            import dryrun
+
+            report = dryrun.dry_run(args.scene, args.quality)
+            if report["error"]:
+                print(report["error"])
+        else:
+            # every play has to run its frames, a cached segment would skip its updaters
+            render_one(args.scene, args.quality, publish=False, overrides={"disable_caching": True})
+    print_summary(profiler, args.sort, args.limit)
+    if args.trace:
+        with open(args.trace, "w", encoding="utf-8") as f:
+            json.dump(profiler.chrome_trace(), f)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(profiler.summary(args.sort), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
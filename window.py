@@ -0,0 +1,144 @@
+"""Render only a time window of a scene.
+
+    python window.py ArcLengthFormula 12 18        # seconds 12 to 18, high quality
+    python window.py NormalVector1 40 -q l         # from 40s to the end, low quality
+
+Everything before the window runs state-only: each play steps through its
+frames so animations and updaters see the same dt as in a full render, but no
+frame is rasterized, piped to ffmpeg or written. From the first frame of the
+window on the scene renders normally, and at its last frame construct() is
+stopped. Plays with no frame inside the window leave no partial movie file,
+the rest are concatenated as usual into ``<Scene>_<start>-<end>`` next to the
+full render in media/.
+"""
+import argparse
+import importlib
+import time
+from pathlib import Path
+
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.exceptions import EndSceneEarlyException
+
+from dryrun import camera_class_of
+from render import MEDIA, QUALITIES, discover
+
+
+class WindowFileWriter(SceneFileWriter):
+    "Opens a play's partial movie stream on its first written frame, a play that writes none drops out of the movie."
+
+    def begin_animation(self, allow_write=False, **kwargs):
+        self.pending = (allow_write, kwargs)
+        self.writing = False
+
+    def write_frame(self, pixels, **kwargs):
+        allow_write, stream = self.pending
+        if allow_write and not self.writing and self.output_spec.is_video:
+            self.open_partial_movie_stream(**stream)
+            self.writing = True
+        super().write_frame(pixels, **kwargs)
+
+    def end_animation(self, allow_write=False):
+        if self.writing:
+            self.close_partial_movie_stream()
+            self.writing = False
+        elif self.partial_movie_files:
+            self.partial_movie_files[-1] = None
+            self.sections[-1].partial_movie_files[-1] = None
+
+
+class WindowRenderer(CairoRenderer):
+    "Steps every frame, rasterizes and writes only frames start <= t < end, stops the scene at end."
+
+    def __init__(self, start=0.0, end=None, **kwargs):
+        super().__init__(file_writer_class=WindowFileWriter, **kwargs)
+        self.start, self.end = start, end
+
+    def frame_index(self):
+        return round(self.time * self.camera.frame_rate)
+
+    def window(self):
+        "First and one-past-last frame index to write."
+        fps = self.camera.frame_rate
+        return round(self.start * fps), (None if self.end is None else round(self.end * fps))
+
+    def stop(self):
+        # close this play's partial movie ourselves, renderer.play never gets to it
+        self.file_writer.end_animation(True)
+        self.num_plays += 1
+        raise EndSceneEarlyException()
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if self.frame_index() < self.window()[0]:
+            # most plays before the window never reach it, the ones that do draw everything per frame
+            self.static_image = None
+            return None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects):
+        first, last = self.window()
+        if self.frame_index() < first:
+            self.time += 1 / self.camera.frame_rate
+        else:
+            super().render(scene, time, moving_mobjects)
+        if last is not None and self.frame_index() >= last:
+            self.stop()
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        first, last = self.window()
+        begin = self.frame_index()
+        end = begin + int(duration / dt)
+        inside = min(end, last if last is not None else end) - max(begin, first)
+        self.time += max(0, min(first, end) - begin) * dt
+        if inside > 0:
+            self.add_frame(self.get_frame(), num_frames=inside)
+        if last is not None and end >= last:
+            self.stop()
+        self.time = end * dt
+
+
+def render_window(name, start, end=None, quality="h", module_name="scene"):
+    "Render seconds start..end of scene `name`, returns (seconds taken, movie path)."
+    module = importlib.import_module(module_name)
+    label = f"{start:g}-{'end' if end is None else f'{end:g}'}"
+    options = {
+        "quality": QUALITIES[quality],
+        "media_dir": str(MEDIA),
+        "tex_dir": str(MEDIA / "Tex" / name),
+        "output_file": f"{name}_{label}",
+        "format": "mp4",
+        # a cached play would be reused whole, window or not
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    began = time.perf_counter()
+    with tempconfig(options):
+        scene_class = getattr(module, name)
+        renderer = WindowRenderer(start, end, camera_class=camera_class_of(scene_class))
+        scene_class(renderer=renderer).render()
+        output = Path(renderer.file_writer.movie_file_path)
+    return time.perf_counter() - began, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene")
+    parser.add_argument("start", type=float, help="seconds into the scene")
+    parser.add_argument("end", type=float, nargs="?", default=None, help="seconds into the scene, default its end")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    args = parser.parse_args()
+    if args.scene not in discover():
+        parser.error(f"unknown scene: {args.scene}")
+    if args.end is not None and args.end <= args.start:
+        parser.error("end must come after start")
+    seconds, output = render_window(args.scene, args.start, args.end, args.quality)
+    if not output.exists():
+        parser.exit(1, f"{args.scene}: nothing rendered, does the scene run past {args.start:g}s?\n")
+    print(f"{args.scene:<26} {seconds:7.1f}s  {output}")
+
+
+if __name__ == "__main__":
+    main()